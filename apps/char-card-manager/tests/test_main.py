@@ -1,13 +1,18 @@
 import pytest
+import sys
 from pathlib import Path
 import importlib.util
 
 def _load_main():
+    cached = sys.modules.get("char_card_manager_main")
+    if cached is not None:
+        return cached
     path = Path(__file__).resolve().parents[1] / "src" / "main.py"
     spec = importlib.util.spec_from_file_location("char_card_manager_main", path)
     module = importlib.util.module_from_spec(spec)
     assert spec and spec.loader
     spec.loader.exec_module(module)
+    sys.modules["char_card_manager_main"] = module
     return module
 
 _main = _load_main()
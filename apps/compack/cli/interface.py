@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import os
+
 from apps.compack.core import ConfigManager, ConversationOrchestrator
 
 
 class CLIInterface:
     """Lightweight CLI interface for Compack."""
 
+    _QUIT_COMMANDS = frozenset({"/quit", "quit", "/exit"})
+    _HELP_COMMANDS = frozenset({"/help", "help"})
+    _CONFIG_COMMANDS = frozenset({"/config", "config"})
+
     def __init__(self, orchestrator: ConversationOrchestrator, config: ConfigManager):
         self.orchestrator = orchestrator
         self.config = config
         self.running = False
+        self._commands = {
+            **dict.fromkeys(self._QUIT_COMMANDS, self._cmd_quit),
+            **dict.fromkeys(self._HELP_COMMANDS, self._cmd_help),
+            **dict.fromkeys(self._CONFIG_COMMANDS, self._cmd_config),
+        }
 
     async def start(self, mode: str = "text", resume: str | None = None) -> None:
         """Start the interactive loop."""
@@ -56,19 +67,25 @@ class CLIInterface:
         print(content, end="", flush=True)
 
     def handle_command(self, command: str) -> bool:
-        cmd = command.lower()
-        if cmd in {"/quit", "quit", "/exit"}:
-            self.running = False
-            self.orchestrator.session.save_session()
-            print("Session saved. Bye.")
-            return True
-        if cmd in {"/help", "help"}:
-            print("Available commands: /help /config /quit")
+        parts = command.split(None, 1)
+        handler = self._commands.get(parts[0].lower()) if parts else None
+        if handler is None:
+            print("Unknown command. Use /help for the list of commands.")
             return False
-        if cmd in {"/config", "config"}:
-            self._display_config()
-            return False
-        print("Unknown command. Use /help for the list of commands.")
+        return handler()
+
+    def _cmd_quit(self) -> bool:
+        self.running = False
+        self.orchestrator.session.save_session()
+        print("Session saved. Bye.")
+        return True
+
+    def _cmd_help(self) -> bool:
+        print("Available commands: /help /config /quit")
+        return False
+
+    def _cmd_config(self) -> bool:
+        self._display_config()
         return False
 
     def wait_for_push_to_talk(self) -> bool:
@@ -89,9 +106,14 @@ class CLIInterface:
         def _latest_session() -> str | None:
             if not sessions:
                 return None
-            paths = [self.orchestrator.session.log_dir / f"{sid}.jsonl" for sid in sessions]
-            latest = max(paths, key=lambda p: p.stat().st_mtime)
-            return latest.stem
+            known = set(sessions)
+            with os.scandir(self.orchestrator.session.log_dir) as it:
+                latest = max(
+                    (e for e in it if e.name.endswith(".jsonl") and e.name[:-6] in known),
+                    key=lambda e: e.stat().st_mtime,
+                    default=None,
+                )
+            return latest.name[:-6] if latest else None
 
         if resume == "new":
             self.orchestrator.session.create_session()
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import os
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from dotenv import load_dotenv
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 from apps.compack.models import Config
 
@@ -14,6 +19,60 @@ ALLOWED_STT = {"openai_whisper", "local_whisper"}
 ALLOWED_LLM = {"openai_gpt4", "ollama"}
 ALLOWED_TTS = {"openai_tts", "pyttsx3"}
 
+_IS_WINDOWS = os.name == "nt"
+
+# resolved path -> (st_mtime_ns, st_size, parsed document)
+_YAML_CACHE: Dict[str, Tuple[int, int, dict]] = {}
+# resolved config path -> (fingerprint, composed Config)
+_CONFIG_CACHE: Dict[str, Tuple[tuple, Config]] = {}
+
+
+def _config_fingerprint(config_path: Path) -> tuple:
+    """Everything _compose_config reads besides the YAML path itself."""
+    try:
+        st = config_path.stat()
+        file_key: tuple = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        file_key = (None, None)
+    env = tuple(
+        sorted(
+            (k, v)
+            for k, v in os.environ.items()
+            if k.startswith("COMPACK_") or k in {"HOME", "USERPROFILE", "LOCALAPPDATA"}
+        )
+    )
+    return file_key + env
+
+
+def _handout(config: Config) -> Config:
+    """Copy a cached Config, including its list fields, so caller mutations don't leak into the cache."""
+    return replace(
+        config,
+        allow_external_categories=_copy_list(config.allow_external_categories),
+        allow_paths=_copy_list(config.allow_paths),
+    )
+
+
+def _copy_list(value: Optional[List[str]]) -> Optional[List[str]]:
+    return list(value) if value is not None else None
+
+
+def _ensure_dirs(config: Config) -> None:
+    """Create the data/log directories (runs on cache hits too, not only when composing)."""
+    dirs = [
+        config.data_dir,
+        config.session_log_dir,
+        config.kb_dir,
+        config.uploads_dir,
+        config.config_dir,
+    ]
+    if config.log_file:
+        dirs.append(config.log_file.parent)
+    for path in dirs:
+        # stat 1 回で済ませつつ、削除されたディレクトリは作り直す
+        if not os.path.isdir(path):
+            Path(path).mkdir(parents=True, exist_ok=True)
+
 
 class ConfigManager:
     """Load Compack configuration from env + YAML with sane defaults."""
@@ -26,14 +85,33 @@ class ConfigManager:
 
     def load(self) -> Config:
         """Load .env and YAML config into a Config dataclass."""
-        load_dotenv(self.env_path, override=False)
-        yaml_config = self._load_yaml(self.config_path)
-        self.config = self._compose_config(yaml_config)
-        return self.config
+        self._load_env()
+        key = str(self.config_path.resolve())
+        fingerprint = _config_fingerprint(self.config_path)
+        cached = _CONFIG_CACHE.get(key)
+        if cached and cached[0] == fingerprint:
+            self.config = _handout(cached[1])
+            _ensure_dirs(self.config)
+            return self.config
+        return self._compose_and_cache(key, fingerprint)
 
     def reload(self) -> Config:
         """Reload configuration to reflect runtime changes."""
-        return self.load()
+        self._load_env()
+        return self._compose_and_cache(str(self.config_path.resolve()), _config_fingerprint(self.config_path))
+
+    def _load_env(self) -> None:
+        from dotenv import load_dotenv
+
+        load_dotenv(self.env_path, override=False)
+
+    def _compose_and_cache(self, key: str, fingerprint: tuple) -> Config:
+        yaml_config = self._load_yaml(self.config_path)
+        composed = self._compose_config(yaml_config)
+        _CONFIG_CACHE[key] = (fingerprint, composed)
+        self.config = _handout(composed)
+        _ensure_dirs(self.config)
+        return self.config
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get an arbitrary config attribute."""
@@ -77,10 +155,18 @@ class ConfigManager:
         return errors
 
     def _load_yaml(self, path: Path) -> dict:
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return {}
+        key = str(path.resolve())
+        cached = _YAML_CACHE.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
         with path.open("r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+        return data
 
     def _resolve_path(self, value: Optional[str]) -> Optional[Path]:
         if value is None:
@@ -94,7 +180,7 @@ class ConfigManager:
         env_dir = os.getenv("COMPACK_DATA_DIR")
         if env_dir:
             return Path(env_dir).expanduser()
-        if os.name == "nt":
+        if _IS_WINDOWS:
             base = os.getenv("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
             return Path(base) / "Compack"
         return Path.home() / ".compack"
@@ -106,6 +192,7 @@ class ConfigManager:
         return [v.strip() for v in val.split(",") if v.strip()]
 
     def _compose_config(self, raw: dict) -> Config:
+        env = os.environ
         stt_cfg = raw.get("stt", {})
         llm_cfg = raw.get("llm", {})
         tts_cfg = raw.get("tts", {})
@@ -117,11 +204,11 @@ class ConfigManager:
         data_cfg = raw.get("data", {})
         profile_cfg = raw.get("profile", {})
 
-        stt_provider = os.getenv("COMPACK_STT_PROVIDER", stt_cfg.get("provider", "local_whisper"))
-        llm_provider = os.getenv("COMPACK_LLM_PROVIDER", llm_cfg.get("provider", "ollama"))
-        tts_provider = os.getenv("COMPACK_TTS_PROVIDER", tts_cfg.get("provider", "pyttsx3"))
+        stt_provider = env.get("COMPACK_STT_PROVIDER", stt_cfg.get("provider", "local_whisper"))
+        llm_provider = env.get("COMPACK_LLM_PROVIDER", llm_cfg.get("provider", "ollama"))
+        tts_provider = env.get("COMPACK_TTS_PROVIDER", tts_cfg.get("provider", "pyttsx3"))
 
-        log_level = os.getenv("COMPACK_LOG_LEVEL", logging_cfg.get("level", "INFO"))
+        log_level = env.get("COMPACK_LOG_LEVEL", logging_cfg.get("level", "INFO"))
         log_file = self._resolve_path(logging_cfg.get("file", "logs/compack.log"))
 
         base_data_dir = self._resolve_path(data_cfg.get("dir")) or self._default_data_dir()
@@ -130,19 +217,19 @@ class ConfigManager:
         uploads_dir = base_data_dir / "uploads"
         config_dir = base_data_dir / "config"
 
-        privacy_mode = str(os.getenv("COMPACK_PRIVACY_MODE", privacy_cfg.get("mode", "normal"))).lower()
-        external_network = str(os.getenv("COMPACK_EXTERNAL_NETWORK", privacy_cfg.get("external", "ask"))).lower()
+        privacy_mode = str(env.get("COMPACK_PRIVACY_MODE", privacy_cfg.get("mode", "normal"))).lower()
+        external_network = str(env.get("COMPACK_EXTERNAL_NETWORK", privacy_cfg.get("external", "ask"))).lower()
         allow_external_categories = self._get_list_env("COMPACK_ALLOW_EXTERNAL_CATEGORIES") or privacy_cfg.get(
             "allow_external_categories", []
         )
         allow_paths = self._get_list_env("COMPACK_ALLOW_PATHS") or privacy_cfg.get("allow_paths", [])
         system_prompt = str(
-            os.getenv(
+            env.get(
                 "COMPACK_SYSTEM_PROMPT",
                 profile_cfg.get("system_prompt", privacy_cfg.get("system_prompt", raw.get("system_prompt", ""))),
             )
         )
-        profile_name = str(os.getenv("COMPACK_PROFILE", profile_cfg.get("name", raw.get("profile_name", "default"))))
+        profile_name = str(env.get("COMPACK_PROFILE", profile_cfg.get("name", raw.get("profile_name", "default"))))
 
         config = Config(
             data_dir=base_data_dir,
@@ -157,18 +244,18 @@ class ConfigManager:
             system_prompt=system_prompt,
             profile_name=profile_name,
             stt_provider=stt_provider,
-            stt_openai_api_key=os.getenv("COMPACK_STT_OPENAI_API_KEY"),
+            stt_openai_api_key=env.get("COMPACK_STT_OPENAI_API_KEY"),
             stt_openai_model=stt_cfg.get("openai", {}).get("model", "whisper-1"),
             stt_local_model=stt_cfg.get("local", {}).get("model", "base"),
             llm_provider=llm_provider,
-            llm_openai_api_key=os.getenv("COMPACK_LLM_OPENAI_API_KEY"),
+            llm_openai_api_key=env.get("COMPACK_LLM_OPENAI_API_KEY"),
             llm_openai_model=llm_cfg.get("openai", {}).get("model", "gpt-4"),
             llm_ollama_base_url=llm_cfg.get("ollama", {}).get("base_url", "http://localhost:11434"),
-            llm_ollama_model=os.getenv("COMPACK_LLM_OLLAMA_MODEL", llm_cfg.get("ollama", {}).get("model", "")),
+            llm_ollama_model=env.get("COMPACK_LLM_OLLAMA_MODEL", llm_cfg.get("ollama", {}).get("model", "")),
             llm_temperature=llm_cfg.get("openai", {}).get("temperature", 0.7),
             llm_max_tokens=llm_cfg.get("openai", {}).get("max_tokens", 1000),
             tts_provider=tts_provider,
-            tts_openai_api_key=os.getenv("COMPACK_TTS_OPENAI_API_KEY"),
+            tts_openai_api_key=env.get("COMPACK_TTS_OPENAI_API_KEY"),
             tts_openai_voice=tts_cfg.get("openai", {}).get("voice", "alloy"),
             tts_openai_speed=float(tts_cfg.get("openai", {}).get("speed", 1.0)),
             tts_pyttsx3_rate=int(tts_cfg.get("pyttsx3", {}).get("rate", 150)),
@@ -183,15 +270,4 @@ class ConfigManager:
             retry_base_delay=float(retry_cfg.get("base_delay", 1.0)),
         )
 
-        for path in [
-            config.data_dir,
-            config.session_log_dir,
-            config.kb_dir,
-            config.uploads_dir,
-            config.config_dir,
-        ]:
-            Path(path).mkdir(parents=True, exist_ok=True)
-        if config.log_file:
-            config.log_file.parent.mkdir(parents=True, exist_ok=True)
-
         return config
@@ -1,13 +1,72 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+_WORD_RE = re.compile(r"\w+")
+_KB_EXTS = frozenset({".txt", ".md", ".json", ".pdf"})
+
+if orjson is not None:
+
+    def _dump_line(entry: Dict) -> bytes:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+else:  # pragma: no cover - exercised only without orjson
+    # json.dumps(ensure_ascii=False) は呼び出しごとに JSONEncoder を作るので使い回す
+    _encoder = json.JSONEncoder(ensure_ascii=False)
+
+    def _dump_line(entry: Dict) -> bytes:
+        return (_encoder.encode(entry) + "\n").encode("utf-8")
+
+    _loads = json.loads
 
 
 def _tokenize(text: str) -> List[str]:
-    return [t.lower() for t in re.findall(r"\w+", text)]
+    return _WORD_RE.findall(text.lower())
+
+
+def _iter_kb_files(root: Path) -> Iterator[Path]:
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if os.path.splitext(name)[1].lower() in _KB_EXTS:
+                yield Path(dirpath, name)
+
+
+@dataclass
+class _IndexSnapshot:
+    """Parsed kb_index.jsonl plus a lazily built inverted index."""
+
+    mtime_ns: int
+    size: int
+    entries: List[Dict]
+    _postings: Optional[Dict[str, np.ndarray]] = None
+    _doc_sizes: Optional[np.ndarray] = None
+
+    def inverted(self) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        if self._postings is None:
+            docs: Dict[str, List[int]] = {}
+            sizes = np.zeros(len(self.entries), dtype=np.int64)
+            for i, e in enumerate(self.entries):
+                tokens = set(e.get("tokens", []))
+                sizes[i] = len(tokens)
+                for t in tokens:
+                    docs.setdefault(t, []).append(i)
+            self._postings = {t: np.asarray(ids, dtype=np.int64) for t, ids in docs.items()}
+            self._doc_sizes = sizes
+        return self._postings, self._doc_sizes
 
 
 class KBManager:
@@ -17,37 +76,58 @@ class KBManager:
         self.kb_dir = Path(kb_dir)
         self.kb_dir.mkdir(parents=True, exist_ok=True)
         self.index_path = self.kb_dir / "kb_index.jsonl"
+        self._index_cache: Optional[_IndexSnapshot] = None
+
+    def _load_cached(self) -> Optional[_IndexSnapshot]:
+        try:
+            st = self.index_path.stat()
+        except FileNotFoundError:
+            self._index_cache = None
+            return None
+        cached = self._index_cache
+        if cached and cached.mtime_ns == st.st_mtime_ns and cached.size == st.st_size:
+            return cached
+        with self.index_path.open("rb") as f:
+            entries = [_loads(line) for line in f if line.strip()]
+        self._index_cache = _IndexSnapshot(mtime_ns=st.st_mtime_ns, size=st.st_size, entries=entries)
+        return self._index_cache
 
     def _load_index(self) -> List[Dict]:
-        if not self.index_path.exists():
-            return []
-        lines = self.index_path.read_text(encoding="utf-8").splitlines()
-        return [json.loads(line) for line in lines if line.strip()]
+        snapshot = self._load_cached()
+        return snapshot.entries if snapshot else []
 
-    def _save_index(self, entries: List[Dict]) -> None:
-        self.index_path.write_text("\n".join(json.dumps(e, ensure_ascii=False) for e in entries), encoding="utf-8")
+    def _needs_leading_newline(self) -> bool:
+        # Older indexes were written without a trailing newline.
+        try:
+            with self.index_path.open("rb") as f:
+                f.seek(-1, 2)
+                return f.read(1) != b"\n"
+        except (FileNotFoundError, OSError):
+            return False
 
     def add_path(self, path: Path) -> int:
         path = Path(path)
-        entries = self._load_index()
         if path.is_dir():
-            files = list(path.rglob("*"))
-        else:
+            files: Iterable[Path] = _iter_kb_files(path)
+        elif path.suffix.lower() in _KB_EXTS:
             files = [path]
+        else:
+            files = []
         added = 0
-        for f in files:
-            if f.is_dir():
-                continue
-            if f.suffix.lower() not in {".txt", ".md", ".json", ".pdf"}:
-                continue
-            try:
-                content = self._read_file(f)
-            except Exception:
-                continue
-            tokens = _tokenize(content)
-            entries.append({"path": str(f.resolve()), "tokens": tokens, "preview": content[:200]})
-            added += 1
-        self._save_index(entries)
+        leading_newline = self._needs_leading_newline()
+        self._index_cache = None
+        with self.index_path.open("ab") as fp:
+            if leading_newline:
+                fp.write(b"\n")
+            for f in files:
+                try:
+                    content = self._read_file(f)
+                except Exception:
+                    continue
+                tokens = sorted(set(_tokenize(content)))
+                entry = {"path": str(f.resolve()), "tokens": tokens, "preview": content[:200]}
+                fp.write(_dump_line(entry))
+                added += 1
         return added
 
     def status(self) -> Dict[str, int]:
@@ -55,18 +135,20 @@ class KBManager:
         return {"entries": len(entries)}
 
     def search(self, query: str, top_k: int = 3) -> List[Dict]:
-        entries = self._load_index()
+        snapshot = self._load_cached()
         q_tokens = set(_tokenize(query))
-        scored: List[Tuple[float, Dict]] = []
-        for e in entries:
-            tokens = set(e.get("tokens", []))
-            if not tokens:
-                continue
-            score = len(q_tokens & tokens) / max(1, len(q_tokens | tokens))
-            if score > 0:
-                scored.append((score, e))
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [dict(match=e[1], score=float(e[0])) for e in scored[:top_k]]
+        if not snapshot or not q_tokens:
+            return []
+        postings, doc_sizes = snapshot.inverted()
+        hits = [postings[t] for t in q_tokens if t in postings]
+        if not hits:
+            return []
+        # Jaccard over token sets: |q & d| / |q | d|, with |q | d| = |q| + |d| - |q & d|.
+        inter = np.bincount(np.concatenate(hits), minlength=len(doc_sizes))
+        scores = inter / np.maximum(len(q_tokens) + doc_sizes - inter, 1)
+        candidates = np.flatnonzero(scores > 0)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")][:top_k]
+        return [dict(match=snapshot.entries[i], score=float(scores[i])) for i in order]
 
     def _read_file(self, path: Path) -> str:
         if path.suffix.lower() == ".pdf":
@@ -1,24 +1,65 @@
 from __future__ import annotations
 
+import json
 import logging
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
-import structlog
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+@lru_cache(maxsize=1024)
+def _is_secret_key(key: str, lowered_tokens: Tuple[str, ...]) -> bool:
+    lowered = key.lower()
+    return any(token in lowered for token in lowered_tokens)
+
+
+# orjson は非 ASCII をそのまま出すので、json.dumps(ensure_ascii=True) と同じくエスケープする
+# （cp932 のコンソールでも落ちず、U+2028 などで1レコードが複数行に割れない）
+_NON_ASCII_RE = re.compile("[^\x00-\x7f]")
+
+
+def _escape_non_ascii(match: "re.Match[str]") -> str:
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+    return f"\\u{code:04x}"
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer 用シリアライザ（orjson が扱えない値は標準 json にフォールバック）。"""
+    try:
+        text = orjson.dumps(obj, default=kwargs.get("default")).decode("utf-8")
+    except TypeError:  # orjson.JSONEncodeError（64bit を超える整数など）
+        return json.dumps(obj, **kwargs)
+    if text.isascii():
+        return text
+    return _NON_ASCII_RE.sub(_escape_non_ascii, text)
 
 
 class StructuredLogger:
     """structlog を用いた構造化ロガー."""
 
     SECRET_KEYS = ("KEY", "TOKEN", "SECRET", "PASSWORD", "API_KEY")
+    _SECRET_LOWER = tuple(token.lower() for token in SECRET_KEYS)
+    _SECRET_VALUE_RE = re.compile("|".join(re.escape(token) for token in _SECRET_LOWER))
 
     def __init__(self, log_file: Path | None = None, level: str = "INFO"):
         self.log_file = Path(log_file) if log_file else None
         self.level = level.upper()
         self.logger = self._setup_logger()
+        self._stdlib_logger = logging.getLogger("compack")
 
     def _setup_logger(self):
+        import structlog
+
         level_value = getattr(logging, self.level, logging.INFO)
         handlers = [logging.StreamHandler(sys.stdout)]
         if self.log_file:
@@ -43,7 +84,9 @@ class StructuredLogger:
                 structlog.processors.add_log_level,
                 structlog.processors.StackInfoRenderer(),
                 structlog.processors.format_exc_info,
-                structlog.processors.JSONRenderer(),
+                structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+                if orjson is not None
+                else structlog.processors.JSONRenderer(),
             ],
             logger_factory=structlog.stdlib.LoggerFactory(),
             wrapper_class=structlog.stdlib.BoundLogger,
@@ -55,24 +98,32 @@ class StructuredLogger:
         def redact(key: str, value: Any) -> Any:
             if isinstance(value, dict):
                 return {k: redact(k, v) for k, v in value.items()}
-            if any(token.lower() in key.lower() for token in self.SECRET_KEYS):
+            if _is_secret_key(key, self._SECRET_LOWER):
                 return "***"
-            if isinstance(value, str) and any(token.lower() in value.lower() for token in self.SECRET_KEYS):
+            if isinstance(value, str) and self._SECRET_VALUE_RE.search(value.lower()):
                 return "***"
             return value
 
         return {k: redact(k, v) for k, v in data.items()}
 
     def debug(self, message: str, **kwargs: Any) -> None:
+        if not self._stdlib_logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug(message, **self._mask_secrets(kwargs))
 
     def info(self, message: str, **kwargs: Any) -> None:
+        if not self._stdlib_logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(message, **self._mask_secrets(kwargs))
 
     def warning(self, message: str, **kwargs: Any) -> None:
+        if not self._stdlib_logger.isEnabledFor(logging.WARNING):
+            return
         self.logger.warning(message, **self._mask_secrets(kwargs))
 
     def error(self, message: str, error: Exception | None = None, **kwargs: Any) -> None:
+        if not self._stdlib_logger.isEnabledFor(logging.ERROR):
+            return
         data = self._mask_secrets(kwargs)
         if error:
             data.update({"error_type": type(error).__name__, "error_message": str(error)})
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import io
 import json
 import re
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from apps.compack.core.logger import StructuredLogger
 from apps.compack.core.privacy_guard import GuardResult, PrivacyGuard
@@ -10,6 +14,15 @@ from apps.compack.core.session import SessionManager
 from apps.compack.modules import LLMModule, STTModule, TTSModule, ToolManager
 from apps.compack.utils import retry_async
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
+
+_GUARD_CACHE_SIZE = 32
+
 
 def _parse_tool_like(text: str) -> Tuple[Optional[str], Optional[dict]]:
     candidate = text.strip()
@@ -17,10 +30,11 @@ def _parse_tool_like(text: str) -> Tuple[Optional[str], Optional[dict]]:
         candidate = candidate.strip("`")
         if candidate.lower().startswith("json"):
             candidate = candidate[4:].strip()
-    if not candidate.startswith("{"):
+    # "name" キーが無ければツール呼び出しではないのでパースしない
+    if not candidate.startswith("{") or '"name"' not in candidate:
         return None, None
     try:
-        data = json.loads(candidate)
+        data = _loads(candidate)
         name = data.get("name")
         args = data.get("arguments") or data.get("args") or {}
         if isinstance(name, str):
@@ -30,15 +44,118 @@ def _parse_tool_like(text: str) -> Tuple[Optional[str], Optional[dict]]:
     return None, None
 
 
+# Shell prompt / command prefix, $var assignment, Windows drive path, script-like extension.
+_CODE_OR_PATH_RE = re.compile(
+    r"^(?:\$|(?i:python |cd |invoke-restmethod))"
+    r"|\$[A-Za-z_]\w*\s*="
+    r"|:\\"
+    r"|(?i:\.(?:ps1|txt|json|py|bat|sh))\b"
+)
+
+
 def _looks_like_code_or_path(text: str) -> bool:
-    low = text.lower()
-    if text.startswith("$") or low.startswith(("python ", "cd ", "invoke-restmethod")):
-        return True
-    if re.search(r"\$[A-Za-z_]\w*\s*=", text):
-        return True
-    if ":\\" in text or re.search(r"\.(ps1|txt|json|py|bat|sh)\b", low):
-        return True
-    return False
+    return _CODE_OR_PATH_RE.search(text) is not None
+
+
+# 外部アクセスが必要そうなキーワードを1回の走査で拾う（weather が general より優先）
+_EXTERNAL_KEYWORD_RE = re.compile(
+    r"(?P<weather>天気|weather)"
+    r"|(?P<general>ニュース|イベント|最新|(?<!\w)(?:latest|news|stock|traffic|nearby|event)(?!\w))"
+)
+
+# 文末（。！？!? と空白が続く .）までを1セグメントとして読み上げる
+_SENTENCE_END_RE = re.compile(r"[。！？!?]+|\.(?=\s)")
+_TTS_SEGMENT_TIMEOUT = 60.0
+
+
+class _SpeechStream:
+    """Speaks LLM output sentence by sentence while the rest is still being generated."""
+
+    def __init__(self, tts: TTSModule, logger: StructuredLogger, notice: Optional[str] = None):
+        self.tts = tts
+        self.logger = logger
+        self._prefix = f"{notice}\n" if notice else ""
+        # 受け取った断片は list に溜め、必要な時だけ join する（保留中の JSON で二乗にならないように）
+        self._pieces: List[str] = []
+        self._streamed = ""
+        self._hold: Optional[bool] = None  # True while the reply may be tool-call JSON
+        self._cancelled = False
+        self._queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    def feed(self, chunk: str) -> None:
+        if self._cancelled:
+            return
+        self._pieces.append(chunk)
+        if self._hold is None:
+            head = "".join(self._pieces).lstrip()
+            if not head:
+                return
+            self._hold = head.startswith(("{", "`"))
+        if self._hold:
+            return
+        # 文末を含みうる断片（"." の後の空白を含む）が来た時だけ結合して探す
+        if not (_SENTENCE_END_RE.search(chunk) or chunk[:1].isspace()):
+            return
+        buffer = "".join(self._pieces)
+        cut = 0
+        for match in _SENTENCE_END_RE.finditer(buffer):
+            cut = match.end()
+        if cut:
+            self._emit(buffer[:cut])
+            buffer = buffer[cut:]
+        self._pieces = [buffer] if buffer else []
+
+    def _emit(self, text: str) -> None:
+        self._streamed += text
+        segment = (self._prefix + text).strip()
+        self._prefix = ""
+        if segment:
+            self._queue.put_nowait(segment)
+
+    def discard(self) -> None:
+        """Drop held text (tool-call JSON) and start over for the next generation."""
+        self._pieces = []
+        self._hold = None
+
+    async def finish(self, final_text: Optional[str]) -> None:
+        """Speak the part of final_text not streamed yet (None: nothing more), then wait for playback."""
+        if self._task.done():
+            return
+        if final_text is not None:
+            streamed = self._streamed.strip()
+            if streamed and final_text.startswith(streamed):
+                final_text = final_text[len(streamed) :]
+            self._emit(final_text)
+        self._queue.put_nowait(None)
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            if not self._cancelled:
+                raise
+
+    def cancel(self) -> None:
+        """Abandon pending synthesis/playback because a newer input arrived."""
+        if self._task.done():
+            return
+        self._cancelled = True
+        self._task.cancel()
+        self.tts.stop()
+
+    async def _run(self) -> None:
+        failed = False
+        while True:
+            segment = await self._queue.get()
+            if segment is None:
+                return
+            if failed:
+                continue
+            try:
+                audio = await asyncio.wait_for(self.tts.synthesize(segment), _TTS_SEGMENT_TIMEOUT)
+                await self.tts.play(audio)
+            except Exception as exc:
+                failed = True
+                self.logger.warning("音声出力に失敗しました", error=exc)
 
 
 class ConversationOrchestrator:
@@ -85,6 +202,8 @@ class ConversationOrchestrator:
         self._pending_external_category: Optional[str] = None
         self._pending_location_category: Optional[str] = None
         self._pending_external_text: Optional[str] = None
+        self._speech: Optional[_SpeechStream] = None
+        self._guard_cache: "OrderedDict[Tuple[str, str, bool], GuardResult]" = OrderedDict()
 
     async def process_voice_input(self, duration: Optional[float] = None) -> str:
         """Record -> STT -> text processing."""
@@ -105,13 +224,31 @@ class ConversationOrchestrator:
             return ""
 
     def _apply_guard(self, text: str, *, for_external: bool = False) -> GuardResult:
-        result = self.privacy_guard.sanitize(text, for_external=for_external)
+        # 直近の入力はサニタイズ結果を使い回す（mode 変更時は別キー）
+        key = (self.privacy_guard.mode, text, for_external)
+        result = self._guard_cache.get(key)
+        if result is None:
+            result = self.privacy_guard.sanitize(text, for_external=for_external)
+            self._guard_cache[key] = result
+            if len(self._guard_cache) > _GUARD_CACHE_SIZE:
+                self._guard_cache.popitem(last=False)
+        else:
+            self._guard_cache.move_to_end(key)
         if result.masked:
             self.logger.info("PrivacyGuard masked input", findings=result.findings, for_external=for_external)
         return result
 
+    def _reply(self, message: str) -> str:
+        """Record an assistant reply, persist the session and return the reply."""
+        self.session.add_message("assistant", message)
+        self.session.save_session()
+        return message
+
     async def process_text_input(self, text: str) -> str:
         """Handle text input including external confirmation and LLM/TTS."""
+        if self._speech:
+            # 新しい入力が来たら前の応答の読み上げは打ち切る
+            self._speech.cancel()
         guard_result = self._apply_guard(text, for_external=False)
         sanitized_text = guard_result.text
 
@@ -127,16 +264,12 @@ class ConversationOrchestrator:
                 if category == "weather":
                     self._pending_location_category = "weather"
                     prompt = "地域名を教えてください（例: 東京/奈良市）"
-                    self.session.add_message("assistant", prompt)
-                    self.session.save_session()
-                    return prompt
+                    return self._reply(prompt)
                 return await self._process_text_with_llm(original, notice=guard_result.notice)
             self._pending_external_category = None
             self._pending_external_text = None
             guidance = "外部アクセスなしで進めます。地域名や手元の最新情報を教えていただければ要約します。"
-            self.session.add_message("assistant", guidance)
-            self.session.save_session()
-            return guidance
+            return self._reply(guidance)
 
         # (2) Pending location for weather
         if self._pending_location_category == "weather":
@@ -149,9 +282,7 @@ class ConversationOrchestrator:
             location = location_result.text.strip()
             if not location:
                 prompt = "地域名を教えてください（例: 東京/奈良市）"
-                self.session.add_message("assistant", prompt)
-                self.session.save_session()
-                return prompt
+                return self._reply(prompt)
             self._pending_location_category = None
             return await self._handle_external_category("weather", location, notice=location_result.notice)
 
@@ -160,28 +291,20 @@ class ConversationOrchestrator:
         if category:
             if self.allowed_categories and category not in self.allowed_categories:
                 guidance = "このカテゴリの外部アクセスは許可されていません。匿名化した情報を直接入力してください。"
-                self.session.add_message("assistant", guidance)
-                self.session.save_session()
-                return guidance
+                return self._reply(guidance)
             if self.external_mode == "deny":
                 guidance = "外部アクセスは無効です。地域名や最新情報を入力いただければ要約します。"
-                self.session.add_message("assistant", guidance)
-                self.session.save_session()
-                return guidance
+                return self._reply(guidance)
             if self.external_mode == "ask" and not self._external_allowed:
                 prompt = "最新情報を取得するため外部アクセスが必要です。許可しますか？ (yes/no)"
                 self._pending_external_confirm = True
                 self._pending_external_category = category
                 self._pending_external_text = sanitized_text
-                self.session.add_message("assistant", prompt)
-                self.session.save_session()
-                return prompt
+                return self._reply(prompt)
             if category == "weather":
                 self._pending_location_category = category
                 prompt = "地域名を教えてください（例: 東京/奈良市）"
-                self.session.add_message("assistant", prompt)
-                self.session.save_session()
-                return prompt
+                return self._reply(prompt)
 
         # (4) Normal LLM path
         return await self._process_text_with_llm(sanitized_text, notice=guard_result.notice)
@@ -189,17 +312,14 @@ class ConversationOrchestrator:
     def _external_category(self, text: str) -> Optional[str]:
         if _looks_like_code_or_path(text):
             return None
-        low = text.lower()
-        if "天気" in text or "weather" in low:
-            return "weather"
-        jp_keywords = ["ニュース", "イベント", "最新"]
-        if any(k in text for k in jp_keywords):
-            return "general"
-        boundary_words = ["latest", "news", "stock", "traffic", "nearby", "event"]
-        for word in boundary_words:
-            if re.search(rf"(?<!\w){re.escape(word)}(?!\w)", low):
-                return "general"
-        return None
+        # 小文字の ASCII 入力ならコピーを作らない
+        low = text if text.isascii() and text.islower() else text.lower()
+        category = None
+        for match in _EXTERNAL_KEYWORD_RE.finditer(low):
+            if match.lastgroup == "weather":
+                return "weather"
+            category = "general"
+        return category
 
     async def _handle_external_category(self, category: str, location: str, notice: Optional[str] = None) -> str:
         if category == "weather":
@@ -212,20 +332,26 @@ class ConversationOrchestrator:
                 message = f"天気取得に失敗しました: {result.error}"
             if notice:
                 message = f"{notice}\n{message}"
-            self.session.add_message("assistant", message)
-            self.session.save_session()
-            return message
+            return self._reply(message)
         fallback = "外部アクセスなしで対応します。関連情報を教えてください。"
-        self.session.add_message("assistant", fallback)
-        self.session.save_session()
-        return fallback
+        return self._reply(fallback)
 
     async def _process_text_with_llm(self, text: str, notice: Optional[str] = None) -> str:
-        self.session.add_message("user", text)
-        context = self.session.get_context()
+        # KB 検索はスレッドで走らせ、その間に履歴コンテキストを組み立てる
+        kb_task = asyncio.create_task(asyncio.to_thread(self.kb.search, text, top_k=3)) if self.kb else None
+        try:
+            self.session.add_message("user", text)
+            context = self.session.get_context()
+        except BaseException:
+            # 検索タスクを放置すると "Task exception was never retrieved" になるので回収してから投げ直す
+            if kb_task:
+                kb_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await kb_task
+            raise
         rag_messages = []
-        if self.kb:
-            results = self.kb.search(text, top_k=3)
+        if kb_task:
+            results = await kb_task
             if results:
                 joined = "\n".join([f"- {r['match']['preview']}" for r in results])
                 rag_messages.append({"role": "system", "content": f"Knowledge base:\n{joined}"})
@@ -233,48 +359,62 @@ class ConversationOrchestrator:
         if self.system_prompt:
             context = [{"role": "system", "content": self.system_prompt}] + context
 
-        response_text = await self._generate_text(context)
-        tool_name, tool_args = _parse_tool_like(response_text)
-        if tool_name:
-            if tool_name in self.tools.tools:
-                result = await self.tools.execute(tool_name, tool_args or {})
-                message = str(result.result or result.error or "")
-                self.session.add_message("assistant", message)
-                self.session.save_session()
-                return message
-            retry_context = context + [
-                {"role": "system", "content": "ツール呼び出しのJSONは出さず、日本語の自然文で回答してください。"}
-            ]
-            retry_text = await self._generate_text(retry_context)
-            retry_name, _ = _parse_tool_like(retry_text)
-            if retry_name:
-                guidance = "内部ツール形式の返答が出ました。普通の文章で言い直してください。"
-                self.session.add_message("assistant", guidance)
-                self.session.save_session()
-                return guidance
-            response_text = retry_text
-
-        if notice:
-            response_text = f"{notice}\n{response_text}"
+        # LLM の生成と並行して文単位で読み上げる
+        speech = _SpeechStream(self.tts, self.logger, notice) if self.enable_tts and self.tts else None
+        self._speech = speech
+        on_chunk = speech.feed if speech else None
+        cancelled = False
+        try:
+            response_text = await self._generate_text(context, on_chunk=on_chunk)
+            tool_name, tool_args = _parse_tool_like(response_text)
+            if tool_name:
+                if speech:
+                    speech.discard()
+                if tool_name in self.tools.tools:
+                    result = await self.tools.execute(tool_name, tool_args or {})
+                    message = str(result.result or result.error or "")
+                    return self._reply(message)
+                retry_context = context + [
+                    {"role": "system", "content": "ツール呼び出しのJSONは出さず、日本語の自然文で回答してください。"}
+                ]
+                retry_text = await self._generate_text(retry_context, on_chunk=on_chunk)
+                retry_name, _ = _parse_tool_like(retry_text)
+                if retry_name:
+                    guidance = "内部ツール形式の返答が出ました。普通の文章で言い直してください。"
+                    return self._reply(guidance)
+                response_text = retry_text
 
-        self.session.add_message("assistant", response_text)
-        self.session.save_session()
+            spoken_text = response_text
+            if notice:
+                response_text = f"{notice}\n{response_text}"
 
-        if self.enable_tts and self.tts:
-            try:
-                audio = await self.tts.synthesize(response_text)
-                self.tts.play_audio(audio)
-            except Exception as exc:
-                self.logger.warning("音声出力に失敗しました", error=exc)
+            self.session.add_message("assistant", response_text)
+            self.session.save_session()
 
-        return response_text
+            if speech:
+                await speech.finish(spoken_text)
+            return response_text
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if speech:
+                # キャンセル時は再生の完了を待たずに打ち切る
+                if cancelled:
+                    speech.cancel()
+                else:
+                    await speech.finish(None)
+                if self._speech is speech:
+                    self._speech = None
 
-    async def _generate_text(self, context: list) -> str:
-        response_parts = []
+    async def _generate_text(self, context: list, on_chunk: Optional[Callable[[str], None]] = None) -> str:
+        buffer = io.StringIO()
         try:
             async for chunk in self.llm.generate_response(context, tools=self.tools.get_tool_schemas()):
-                response_parts.append(chunk)
-            response_text = "".join(response_parts).strip()
+                buffer.write(chunk)
+                if on_chunk:
+                    on_chunk(chunk)
+            response_text = buffer.getvalue().strip()
         except Exception as exc:
             self.logger.error(
                 "LLM生成に失敗しました",
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
 import json
-import uuid
+import mmap
+import os
+import secrets
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import List, Optional, TextIO, Tuple
 
 from apps.compack.core import StructuredLogger
 from apps.compack.models import Message, Session
 
+# metadata なしのメッセージで共有する読み取り専用の空 dict
+_EMPTY_META = MappingProxyType({})
+
+
+def _write_lines(fh: TextIO, messages: List[Message]) -> None:
+    """Write the cached JSONL lines of messages with a single join."""
+    if messages:
+        fh.write("\n".join([m.to_json() for m in messages]))
+        fh.write("\n")
+
 
 class SessionManager:
     """セッションの生成・保存・復元を管理する。"""
@@ -20,10 +33,12 @@ class SessionManager:
         self.current_session_id: Optional[str] = None
         self.messages: List[Message] = []
         self.created_at: Optional[datetime] = None
+        # (session_id, messages list, count) already on disk; save_session appends only the rest.
+        self._persisted: Optional[Tuple[str, List[Message], int]] = None
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
     def create_session(self) -> str:
-        self.current_session_id = uuid.uuid4().hex
+        self.current_session_id = secrets.token_hex(16)
         self.messages = []
         self.created_at = datetime.utcnow()
         self.logger.info("新規セッション生成", session_id=self.current_session_id)
@@ -35,8 +50,13 @@ class SessionManager:
             raise FileNotFoundError(f"セッション {session_id} が見つかりません。")
 
         try:
-            content = path.read_text(encoding="utf-8")
-            session = Session.from_jsonl(session_id=session_id, jsonl_data=content)
+            with path.open("rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    session = Session.from_jsonl(session_id=session_id, jsonl_data="")
+                else:
+                    # 全文を str にデコードせず、マップしたまま1行ずつパースする
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        session = Session.from_jsonl_mmap(session_id=session_id, buffer=mm)
         except Exception as exc:
             self.logger.error("セッション読み込みに失敗しました", error=exc, session_id=session_id)
             raise
@@ -48,22 +68,37 @@ class SessionManager:
         return self.messages
 
     def add_message(self, role: str, content: str, metadata: Optional[dict] = None) -> None:
-        message = Message(role=role, content=content, timestamp=datetime.utcnow(), metadata=metadata or {})
+        message = Message(role=role, content=content, timestamp=datetime.utcnow(), metadata=metadata or _EMPTY_META)
         self.messages.append(message)
         self.logger.debug("メッセージ追加", role=role, length=len(content))
 
     def save_session(self) -> Path:
         if not self.current_session_id:
-            self.current_session_id = uuid.uuid4().hex
+            self.current_session_id = secrets.token_hex(16)
             self.created_at = self.created_at or datetime.utcnow()
         session = Session(
-            session_id=self.current_session_id or uuid.uuid4().hex,
+            session_id=self.current_session_id or secrets.token_hex(16),
             created_at=self.created_at or datetime.utcnow(),
             updated_at=datetime.utcnow(),
             messages=self.messages,
         )
         path = self.log_dir / f"{session.session_id}.jsonl"
-        path.write_text(session.to_jsonl(), encoding="utf-8")
+        persisted = self._persisted
+        if (
+            persisted
+            and persisted[0] == session.session_id
+            and persisted[1] is self.messages
+            and persisted[2] <= len(self.messages)
+            and path.exists()
+        ):
+            if len(self.messages) > persisted[2]:
+                with path.open("a", encoding="utf-8") as fh:
+                    _write_lines(fh, self.messages[persisted[2] :])
+        else:
+            # 初回・セッション切替・復元直後は全体を書き直す（旧形式の末尾改行なしも正規化）
+            with path.open("w", encoding="utf-8") as fh:
+                _write_lines(fh, self.messages)
+        self._persisted = (session.session_id, self.messages, len(self.messages))
         self.logger.info("セッション保存完了", session_id=session.session_id, path=str(path))
         return path
 
@@ -73,4 +108,5 @@ class SessionManager:
     def get_context(self, max_messages: Optional[int] = None) -> List[dict]:
         limit = max_messages or self.max_context_messages
         tail = self.messages[-limit:] if limit else self.messages
+        # 呼び出し側が変更しても次のターンに漏れないよう、毎回新しい dict を返す
         return [m.to_dict() for m in tail]
@@ -181,11 +181,15 @@ async def main() -> None:
         system_prompt=config.system_prompt,
         profile_name=config.profile_name,
     )
-    if args.ui == "web":
-        start_web_ui(orchestrator, host="127.0.0.1", port=8765, open_browser=args.open_browser)
-    else:
-        cli = CLIInterface(orchestrator, config_manager)
-        await cli.start(mode=args.mode, resume=args.resume)
+    try:
+        if args.ui == "web":
+            start_web_ui(orchestrator, host="127.0.0.1", port=8765, open_browser=args.open_browser)
+        else:
+            cli = CLIInterface(orchestrator, config_manager)
+            await cli.start(mode=args.mode, resume=args.resume)
+    finally:
+        if tts is not None:
+            tts.close()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+_OPENAI_MODELS_URL = "https://api.openai.com/v1/models"
+_LIVE_PROBE_TIMEOUT = 2.0
 
-@dataclass
+
+@dataclass(slots=True)
 class Config:
     """設定データモデル."""
 
@@ -80,49 +85,97 @@ class Config:
 
         return errors
 
+    async def validate_live(
+        self, skip_stt: bool = False, skip_tts: bool = False, timeout: float = _LIVE_PROBE_TIMEOUT
+    ) -> List[str]:
+        """設定済みプロバイダの疎通を並行して確認し、エラーメッセージを返す。
+
+        各エンドポイントへの確認は同時に走るので、所要時間は最も遅い1件分で済む。
+        """
+        import requests
+
+        probes: List[Tuple[str, str, Optional[str]]] = []
+        if not skip_stt and self.stt_provider == "openai_whisper" and self.stt_openai_api_key:
+            probes.append(("STT", _OPENAI_MODELS_URL, self.stt_openai_api_key))
+        if self.llm_provider == "openai_gpt4" and self.llm_openai_api_key:
+            probes.append(("LLM", _OPENAI_MODELS_URL, self.llm_openai_api_key))
+        elif self.llm_provider == "ollama":
+            probes.append(("LLM", f"{self.llm_ollama_base_url.rstrip('/')}/api/tags", None))
+        if not skip_tts and self.tts_provider == "openai_tts" and self.tts_openai_api_key:
+            probes.append(("TTS", _OPENAI_MODELS_URL, self.tts_openai_api_key))
+
+        def _probe(url: str, api_key: Optional[str]) -> int:
+            headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+            return requests.get(url, headers=headers, timeout=timeout).status_code
+
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_probe, url, key) for _, url, key in probes), return_exceptions=True
+        )
+        errors: List[str] = []
+        for (label, url, _), result in zip(probes, results):
+            if isinstance(result, BaseException):
+                errors.append(f"{label}: {url} に接続できません: {result}")
+            elif result in (401, 403):
+                errors.append(f"{label}: API キーが拒否されました (HTTP {result})。")
+            elif result >= 400:
+                errors.append(f"{label}: {url} が HTTP {result} を返しました。")
+        return errors
+
     def to_dict(self) -> Dict[str, Any]:
         """Expose config as a serializable dict."""
-        return {
-            "data_dir": str(self.data_dir),
-            "kb_dir": str(self.kb_dir),
-            "uploads_dir": str(self.uploads_dir),
-            "config_dir": str(self.config_dir),
-            "privacy_mode": self.privacy_mode,
-            "external_network": self.external_network,
-            "allow_external_categories": self.allow_external_categories or [],
-            "allow_paths": self.allow_paths or [],
-            "system_prompt": self.system_prompt,
-            "profile_name": self.profile_name,
-            "stt_provider": self.stt_provider,
-            "stt_openai_api_key": self.stt_openai_api_key,
-            "stt_openai_model": self.stt_openai_model,
-            "stt_local_model": self.stt_local_model,
-            "llm_provider": self.llm_provider,
-            "llm_openai_api_key": self.llm_openai_api_key,
-            "llm_openai_model": self.llm_openai_model,
-            "llm_ollama_base_url": self.llm_ollama_base_url,
-            "llm_ollama_model": self.llm_ollama_model,
-            "llm_temperature": self.llm_temperature,
-            "llm_max_tokens": self.llm_max_tokens,
-            "tts_provider": self.tts_provider,
-            "tts_openai_api_key": self.tts_openai_api_key,
-            "tts_openai_voice": self.tts_openai_voice,
-            "tts_openai_speed": self.tts_openai_speed,
-            "tts_pyttsx3_rate": self.tts_pyttsx3_rate,
-            "tts_pyttsx3_volume": self.tts_pyttsx3_volume,
-            "session_log_dir": str(self.session_log_dir),
-            "session_max_context_messages": self.session_max_context_messages,
-            "log_file": str(self.log_file) if self.log_file else None,
-            "log_level": self.log_level,
-            "audio_sample_rate": self.audio_sample_rate,
-            "audio_channels": self.audio_channels,
-            "audio_record_duration": self.audio_record_duration,
-            "retry_max_attempts": self.retry_max_attempts,
-            "retry_base_delay": self.retry_base_delay,
-        }
-
-
-@dataclass
+        data = {name: getattr(self, name) for name in _CONFIG_DICT_FIELDS}
+        for name in _CONFIG_PATH_FIELDS:
+            data[name] = os.fspath(data[name])
+        if data["log_file"] is not None:
+            data["log_file"] = os.fspath(data["log_file"])
+        data["allow_external_categories"] = data["allow_external_categories"] or []
+        data["allow_paths"] = data["allow_paths"] or []
+        return data
+
+
+# to_dict の出力順（従来の dict リテラルと同じ順序）
+_CONFIG_DICT_FIELDS = (
+    "data_dir",
+    "kb_dir",
+    "uploads_dir",
+    "config_dir",
+    "privacy_mode",
+    "external_network",
+    "allow_external_categories",
+    "allow_paths",
+    "system_prompt",
+    "profile_name",
+    "stt_provider",
+    "stt_openai_api_key",
+    "stt_openai_model",
+    "stt_local_model",
+    "llm_provider",
+    "llm_openai_api_key",
+    "llm_openai_model",
+    "llm_ollama_base_url",
+    "llm_ollama_model",
+    "llm_temperature",
+    "llm_max_tokens",
+    "tts_provider",
+    "tts_openai_api_key",
+    "tts_openai_voice",
+    "tts_openai_speed",
+    "tts_pyttsx3_rate",
+    "tts_pyttsx3_volume",
+    "session_log_dir",
+    "session_max_context_messages",
+    "log_file",
+    "log_level",
+    "audio_sample_rate",
+    "audio_channels",
+    "audio_record_duration",
+    "retry_max_attempts",
+    "retry_base_delay",
+)
+_CONFIG_PATH_FIELDS = ("data_dir", "kb_dir", "uploads_dir", "config_dir", "session_log_dir")
+
+
+@dataclass(slots=True)
 class ToolResult:
     """ツール実行結果モデル."""
 
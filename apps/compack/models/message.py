@@ -1,33 +1,62 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-@dataclass
+# 復元したメッセージの role 文字列を共有する
+_ROLES = {role: sys.intern(role) for role in ("user", "assistant", "system", "tool")}
+
+
+@dataclass(frozen=True, slots=True)
 class Message:
-    """会話メッセージモデル."""
+    """会話メッセージモデル（不変。JSONL 行は初回生成後に使い回す）."""
 
     role: str  # "user" | "assistant" | "system" | "tool"
     content: str
     timestamp: datetime
     metadata: Optional[Dict[str, Any]] = None
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO 8601 timestamp, formatted once per message."""
+        if self._timestamp_iso is None:
+            object.__setattr__(self, "_timestamp_iso", self.timestamp.isoformat())
+        return self._timestamp_iso
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to a serializable dict."""
         return {
             "role": self.role,
             "content": self.content,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "metadata": self.metadata or {},
         }
 
+    def to_json(self) -> str:
+        """Serialize message to a single JSONL line (no trailing newline)."""
+        if self._json is None:
+            if orjson is not None:
+                line = orjson.dumps(self.to_dict()).decode("utf-8")
+            else:
+                line = json.dumps(self.to_dict(), ensure_ascii=True)
+            object.__setattr__(self, "_json", line)
+        return self._json
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Message":
         """Restore a Message from its dict form."""
         return cls(
-            role=data["role"],
+            role=_ROLES.get(data["role"], data["role"]),
             content=data["content"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
             metadata=data.get("metadata") or {},
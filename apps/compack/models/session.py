@@ -1,12 +1,35 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from .message import Message
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
+
+
+def _iter_lines(data: Union[str, bytes, mmap.mmap]) -> Iterator[Union[str, bytes]]:
+    """Yield "\n"-separated lines lazily, without building a list of the whole file."""
+    # "\n" のみで区切る（JSON 文字列内に生の U+2028/U+0085 が入り得るため splitlines は使わない）
+    sep = "\n" if isinstance(data, str) else b"\n"
+    start, size = 0, len(data)
+    while start < size:
+        end = data.find(sep, start)
+        if end == -1:
+            end = size
+        yield data[start:end]
+        start = end + 1
+
 
 @dataclass
 class Session:
@@ -25,22 +48,61 @@ class Session:
 
     def to_jsonl(self) -> str:
         """Serialize messages to JSONL string."""
-        return "\n".join(json.dumps(msg.to_dict(), ensure_ascii=True) for msg in self.messages)
+        return "\n".join(msg.to_json() for msg in self.messages)
 
     @classmethod
     def from_jsonl(
         cls,
         session_id: str,
-        jsonl_data: str,
+        jsonl_data: Union[str, bytes, IO[bytes]],
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "Session":
+        """Rehydrate a Session from JSONL content (text, bytes or a binary file object)."""
+        if isinstance(jsonl_data, (str, bytes)):
+            lines: Iterable[Union[str, bytes]] = _iter_lines(jsonl_data)
+        else:
+            lines = jsonl_data
+        messages = [Message.from_dict(_loads(line)) for line in lines if line.strip()]
+        return cls._restored(session_id, messages, created_at, updated_at, metadata)
+
+    @classmethod
+    def from_jsonl_mmap(
+        cls,
+        session_id: str,
+        buffer: Union[bytes, mmap.mmap],
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> "Session":
-        """Rehydrate a Session from JSONL content."""
-        messages = []
-        for line in filter(None, jsonl_data.splitlines()):
-            messages.append(Message.from_dict(json.loads(line)))
+        """Rehydrate a Session from a mapped JSONL file without decoding it as a whole."""
+        messages = [Message.from_dict(_loads(line)) for line in _iter_lines(buffer) if line.strip()]
+        return cls._restored(session_id, messages, created_at, updated_at, metadata)
 
+    @classmethod
+    def load_path(
+        cls,
+        path: Union[str, os.PathLike],
+        session_id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "Session":
+        """Stream a JSONL file line by line; session_id defaults to the file stem."""
+        path = Path(path)
+        with path.open("rb") as fh:
+            return cls.from_jsonl(session_id or path.stem, fh, created_at, updated_at, metadata)
+
+    @classmethod
+    def _restored(
+        cls,
+        session_id: str,
+        messages: List[Message],
+        created_at: Optional[datetime],
+        updated_at: Optional[datetime],
+        metadata: Optional[Dict[str, Any]],
+    ) -> "Session":
         now = datetime.utcnow()
         return cls(
             session_id=session_id,
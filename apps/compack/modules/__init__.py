@@ -16,5 +16,3 @@ __all__ = [
     "Tool",
     "ToolManager",
 ]
-
-__all__ = ["STTError", "STTModule", "STTProvider"]
@@ -40,8 +40,9 @@ class LLMModule:
 
     def build_context(self, history: List[dict], user_input: str) -> List[dict]:
         """Compose context using the latest N messages and current user input."""
-        tail = history[-self.max_context_messages :] if self.max_context_messages else history
-        context = tail + [{"role": "user", "content": user_input}]
+        # スライスは新しいリストなので、そのまま末尾に追加する（連結で二重にコピーしない）
+        context = history[-self.max_context_messages :] if self.max_context_messages else list(history)
+        context.append({"role": "user", "content": user_input})
         return context
 
     async def generate_response(
@@ -51,6 +52,7 @@ class LLMModule:
     ) -> AsyncIterator[str]:
         """Stream responses from the provider with error handling."""
         try:
+            # 戻り値で判定する（def で async iterator を返す provider やラップされた generate にも対応）
             result = self.provider.generate(context, tools=tools, stream=True)
             if hasattr(result, "__aiter__"):
                 async for chunk in result:  # type: ignore[attr-defined]
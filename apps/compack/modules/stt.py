@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 
@@ -36,9 +36,16 @@ class STTModule:
         self.logger = logger
         self.sample_rate = sample_rate
         self.channels = channels
+        self._rec_buf: Optional[np.ndarray] = None
+        # channels > 1 のときのダウンミックス用（録音バッファと同じ長さで確保）
+        self._mix_buf: Optional[np.ndarray] = None
+        self._mono_buf: Optional[np.ndarray] = None
 
     def record_audio(self, duration: float = 5.0) -> Tuple[np.ndarray, int]:
-        """Record audio for the given duration."""
+        """Record audio for the given duration.
+
+        返り値は録音バッファのビューで、次の録音で上書きされる。保持する場合はコピーすること。
+        """
         try:
             import sounddevice as sd
         except ImportError as exc:
@@ -47,10 +54,24 @@ class STTModule:
 
         try:
             frames = int(duration * self.sample_rate)
-            recording = sd.rec(frames, samplerate=self.sample_rate, channels=self.channels, dtype="float32")
+            buf = self._rec_buf
+            if buf is None or len(buf) < frames:
+                # Whisper に送る WAV は 16bit PCM なので、最初から int16 で録る
+                buf = self._rec_buf = np.empty((frames, self.channels), dtype=np.int16)
+                if self.channels > 1:
+                    self._mix_buf = np.empty(frames, dtype=np.int32)
+                    self._mono_buf = np.empty(frames, dtype=np.int16)
+            recording = buf[:frames]
+            sd.rec(samplerate=self.sample_rate, out=recording)
             sd.wait()
             self.logger.info("録音完了", frames=frames, sample_rate=self.sample_rate, channels=self.channels)
-            return np.squeeze(recording), self.sample_rate
+            if self.channels > 1:
+                # int32 で合計してから割り、確保済みの int16 モノラルバッファへ書き込む
+                mixed = np.sum(recording, axis=1, dtype=np.int32, out=self._mix_buf[:frames])
+                audio = np.floor_divide(mixed, self.channels, out=self._mono_buf[:frames], casting="unsafe")
+            else:
+                audio = recording[:, 0]
+            return audio, self.sample_rate
         except Exception as exc:
             self.logger.error("録音に失敗しました", error=exc)
             raise STTError("録音に失敗しました。") from exc
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any, Dict, List
 
 from apps.compack.core import StructuredLogger
@@ -30,6 +31,15 @@ class Tool(ABC):
     async def execute(self, **kwargs) -> dict:
         raise NotImplementedError
 
+    @cached_property
+    def schema(self) -> dict:
+        """LLM に渡すスキーマ（ツールごとに一度だけ組み立てる）。"""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "parameters": self.parameters,
+        }
+
 
 class ToolManager:
     """チールの登録と実行を管理する。"""
@@ -37,20 +47,20 @@ class ToolManager:
     def __init__(self, logger: StructuredLogger):
         self.tools: Dict[str, Tool] = {}
         self.logger = logger
+        self._schema_list: List[dict] = []
 
     def register(self, tool: Tool) -> None:
+        replaced = tool.name in self.tools
         self.tools[tool.name] = tool
+        if replaced:
+            self._schema_list = [t.schema for t in self.tools.values()]
+        else:
+            self._schema_list.append(tool.schema)
         self.logger.debug("ツール登録", tool=tool.name)
 
     def get_tool_schemas(self) -> List[dict]:
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": tool.parameters,
-            }
-            for tool in self.tools.values()
-        ]
+        """登録済みツールのスキーマ一覧（共有リストなので呼び出し側で変更しないこと）。"""
+        return self._schema_list
 
     async def execute(self, tool_name: str, args: Dict[str, Any]) -> ToolResult:
         tool = self.tools.get(tool_name)
@@ -19,6 +19,9 @@ class TTSProvider(ABC):
         """Synthesize audio bytes from text."""
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Release provider resources (no-op by default)."""
+
 
 class TTSModule:
     """音声合成と再生のファサード."""
@@ -40,7 +43,12 @@ class TTSModule:
             self.logger.error("音声合成に失敗しました", error=exc)
             raise
 
+    async def play(self, audio_data: bytes) -> None:
+        """Play audio on a worker thread so the event loop keeps running during playback."""
+        await asyncio.to_thread(self.play_audio, audio_data)
+
     def play_audio(self, audio_data: bytes) -> None:
+        """Blocking playback; call from a worker thread (see play)."""
         try:
             import pygame
         except ImportError as exc:
@@ -58,3 +66,17 @@ class TTSModule:
         except Exception as exc:
             self.logger.error("音声再生に失敗しました", error=exc)
             raise TTSError("音声再生に失敗しました。") from exc
+
+    def stop(self) -> None:
+        """Stop playback started by play_audio (no-op when nothing is playing)."""
+        try:
+            import pygame
+        except ImportError:
+            return
+        if pygame.mixer.get_init():
+            pygame.mixer.stop()
+
+    def close(self) -> None:
+        """Stop playback and release the provider; call once on shutdown."""
+        self.stop()
+        self.provider.close()
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import AsyncIterator, Dict, List, Optional, Tuple
+import threading
+from typing import AsyncIterator, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from apps.compack.modules.llm import LLMError, LLMProvider
+from apps.compack.providers.streaming import iterate_in_thread
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
 
 
 class OllamaModelNotFound(LLMError):
@@ -20,7 +31,23 @@ class OllamaLLM(LLMProvider):
         self.model = model
         self.temperature = temperature
         self._model_checked = False
+        self._checked_model: Optional[str] = None
         self._cached_tags: Optional[List[str]] = None
+        # (tag list, frozenset of it) so membership checks don't rebuild the set
+        self._cached_tag_set: Optional[Tuple[List[str], FrozenSet[str]]] = None
+        # keep-alive 接続プールは共有し、スレッドセーフでない Session はワーカースレッドごとに持つ
+        self._adapter = HTTPAdapter()
+        self._local = threading.local()
+
+    @property
+    def _http(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+        return session
 
     async def generate(
         self,
@@ -28,16 +55,22 @@ class OllamaLLM(LLMProvider):
         tools: Optional[List[dict]] = None,
         stream: bool = True,
     ) -> AsyncIterator[str]:
+        # requests はブロッキングなので、HTTP 待ちはワーカースレッドで行いイベントループを止めない
+        if self._cached_tags is None:
+            await asyncio.to_thread(self._load_tags)
         self.ensure_model_exists(allow_autoselect=True, raise_on_missing=True)
         payload = {"model": self.model, "messages": messages, "stream": stream, "options": {"temperature": self.temperature}}
         if stream:
-            for chunk in self._stream(payload):
+            resp = await asyncio.to_thread(self._open_stream, payload)
+            async for chunk in iterate_in_thread(self._iter_chunks(resp), close=resp.close):
                 yield chunk
         else:
-            yield self._complete(payload)
+            yield await asyncio.to_thread(self._complete, payload)
 
     def ensure_model_exists(self, allow_autoselect: bool, raise_on_missing: bool) -> Dict[str, object]:
         """Verify the configured model and optionally auto-select one if missing."""
+        if self._model_checked and self._checked_model == self.model and self._cached_tags is not None:
+            return {"auto_selected": False, "model_exists": True, "models": self._cached_tags}
         tags = self._load_tags()
         info = {"auto_selected": False, "model_exists": True, "models": tags}
         if not tags:
@@ -47,7 +80,7 @@ class OllamaLLM(LLMProvider):
             return info
 
         if self.model:
-            if self.model not in tags:
+            if self.model not in self._tag_set(tags):
                 info["model_exists"] = False
                 if raise_on_missing:
                     preview = ", ".join(tags[:5])
@@ -59,18 +92,20 @@ class OllamaLLM(LLMProvider):
                     )
                 return info
             self._model_checked = True
+            self._checked_model = self.model
             return info
 
         if allow_autoselect:
-            self.model = self._choose_preferred_model(tags)
+            self.model = self._choose_preferred_model(tags, self._tag_set(tags))
             info["auto_selected"] = True
             self._model_checked = True
+            self._checked_model = self.model
         return info
 
     def _load_tags(self) -> List[str]:
         if self._cached_tags is not None:
             return self._cached_tags
-        resp = requests.get(f"{self.base_url}/api/tags", timeout=5)
+        resp = self._http.get(f"{self.base_url}/api/tags", timeout=5)
         resp.raise_for_status()
         data = resp.json() or {}
         models = []
@@ -79,39 +114,71 @@ class OllamaLLM(LLMProvider):
             if name:
                 models.append(name)
         self._cached_tags = models
+        self._cached_tag_set = (models, frozenset(models))
         return models
 
+    def _tag_set(self, tags: List[str]) -> FrozenSet[str]:
+        # 同じタグリストに対しては一度作った set を使い回す
+        cached = self._cached_tag_set
+        if cached is None or cached[0] is not tags:
+            cached = self._cached_tag_set = (tags, frozenset(tags))
+        return cached[1]
+
     @staticmethod
-    def _choose_preferred_model(models: List[str]) -> str:
+    def _choose_preferred_model(models: List[str], available: Optional[FrozenSet[str]] = None) -> str:
         preferred = ["hhao/qwen2.5-coder-tools:7b", "qwen2.5-coder:7b", "qwen2.5:7b"]
+        if available is None:
+            available = frozenset(models)
         for cand in preferred:
-            if cand in models:
+            if cand in available:
                 return cand
         return models[0]
 
-    def _stream(self, payload: dict) -> AsyncIterator[str]:
-        with requests.post(f"{self.base_url}/api/chat", json=payload, stream=True, timeout=30) as resp:
-            try:
-                resp.raise_for_status()
-            except requests.HTTPError as exc:
+    def _open_stream(self, payload: dict) -> requests.Response:
+        resp = self._http.post(f"{self.base_url}/api/chat", json=payload, stream=True, timeout=30)
+        try:
+            resp.raise_for_status()
+        except requests.HTTPError as exc:
+            with resp:
                 self._raise_detailed_error(resp, exc)
-            for line in resp.iter_lines():
-                if not line:
-                    continue
-                data = json.loads(line.decode("utf-8"))
-                message = data.get("message", {})
-                content = message.get("content") or data.get("response")
-                if content:
-                    yield content
+        return resp
+
+    def _iter_chunks(self, resp: requests.Response) -> Iterator[str]:
+        with resp:
+            # NDJSON を bytes のまま行に切り出し、デコードせずにパースする
+            pending = bytearray()
+            for block in resp.iter_content(chunk_size=8192):
+                pending += block
+                start = 0
+                while True:
+                    end = pending.find(b"\n", start)
+                    if end == -1:
+                        break
+                    content = self._chunk_content(pending[start:end])
+                    start = end + 1
+                    if content:
+                        yield content
+                del pending[:start]
+            content = self._chunk_content(pending)
+            if content:
+                yield content
+
+    @staticmethod
+    def _chunk_content(line: bytes) -> Optional[str]:
+        if not line.strip():
+            return None
+        data = _loads(line)
+        message = data.get("message", {})
+        return message.get("content") or data.get("response")
 
     def _complete(self, payload: dict) -> str:
         payload["stream"] = False
-        response = requests.post(f"{self.base_url}/api/chat", json=payload, timeout=30)
+        response = self._http.post(f"{self.base_url}/api/chat", json=payload, timeout=30)
         try:
             response.raise_for_status()
         except requests.HTTPError as exc:
             self._raise_detailed_error(response, exc)
-        data = response.json()
+        data = _loads(response.content)
         message = data.get("message", {})
         return message.get("content") or data.get("response", "")
 
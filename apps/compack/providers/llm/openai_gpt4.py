@@ -1,17 +1,18 @@
 from __future__ import annotations
 
-from typing import AsyncIterator, List, Optional, Tuple
-
-import openai
+import asyncio
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 
 from apps.compack.modules.llm import LLMProvider
+from apps.compack.providers.openai_client import get_openai_client
+from apps.compack.providers.streaming import iterate_in_thread
 
 
 class OpenAIGPT4LLM(LLMProvider):
     """OpenAI GPT-4 provider."""
 
     def __init__(self, api_key: str, model: str = "gpt-4", temperature: float = 0.7, max_tokens: int = 1000):
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
@@ -22,14 +23,16 @@ class OpenAIGPT4LLM(LLMProvider):
         tools: Optional[List[dict]] = None,
         stream: bool = True,
     ) -> AsyncIterator[str]:
+        # SDK はブロッキングなので、HTTP 待ちとストリーム読み込みはワーカースレッドで行う
         if stream:
-            for chunk in self._stream_response(messages, tools):
+            response = await asyncio.to_thread(self._open_stream, messages, tools)
+            async for chunk in iterate_in_thread(self._iter_deltas(response), close=response.close):
                 yield chunk
         else:
-            yield self._create_completion(messages, tools)
+            yield await asyncio.to_thread(self._create_completion, messages, tools)
 
-    def _stream_response(self, messages: List[dict], tools: Optional[List[dict]]) -> AsyncIterator[str]:
-        response = self.client.chat.completions.create(
+    def _open_stream(self, messages: List[dict], tools: Optional[List[dict]]):
+        return self.client.chat.completions.create(
             model=self.model,
             messages=messages,
             tools=tools,
@@ -37,6 +40,9 @@ class OpenAIGPT4LLM(LLMProvider):
             temperature=self.temperature,
             max_tokens=self.max_tokens,
         )
+
+    @staticmethod
+    def _iter_deltas(response) -> Iterator[str]:
         for chunk in response:
             delta = chunk.choices[0].delta
             if delta and delta.content:
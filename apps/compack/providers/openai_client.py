@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict
+
+import openai
+
+# API キーごとに1つのクライアント（＝接続プール）を STT/LLM/TTS で共有する
+_client_cache: Dict[str, openai.OpenAI] = {}
+_client_lock = threading.Lock()
+
+
+def get_openai_client(api_key: str) -> openai.OpenAI:
+    """Return the shared OpenAI client for this API key."""
+    client = _client_cache.get(api_key)
+    if client is None:
+        with _client_lock:
+            client = _client_cache.get(api_key)
+            if client is None:
+                client = _client_cache[api_key] = openai.OpenAI(api_key=api_key)
+    return client
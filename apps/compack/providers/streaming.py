@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import AsyncIterator, Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def iterate_in_thread(iterator: Iterator[T], close: Optional[Callable[[], None]] = None) -> AsyncIterator[T]:
+    """Iterate a blocking iterator on worker threads so the event loop keeps running.
+
+    ``close`` releases the underlying resource (e.g. the streaming HTTP response). On
+    cancellation it is called first to unblock the in-flight ``next()``, which is then
+    awaited before the iterator itself is closed.
+    """
+    pending: Optional[asyncio.Future] = None
+    try:
+        while True:
+            pending = asyncio.ensure_future(asyncio.to_thread(next, iterator, _DONE))
+            item = await asyncio.shield(pending)
+            pending = None
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        if close is not None:
+            with contextlib.suppress(Exception):
+                close()
+        if pending is not None:
+            # next() 実行中の generator を close すると ValueError になるため、先に終わるのを待つ
+            with contextlib.suppress(Exception):
+                await pending
+        close_iterator = getattr(iterator, "close", None)
+        if close_iterator is not None:
+            close_iterator()
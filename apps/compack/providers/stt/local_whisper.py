@@ -6,7 +6,9 @@ from typing import Optional
 import numpy as np
 
 from apps.compack.modules.stt import STTProvider
-from apps.compack.utils.audio import to_wav_bytes
+from apps.compack.utils.audio import to_float32
+
+_WHISPER_SAMPLE_RATE = 16000
 
 
 class LocalWhisperSTT(STTProvider):
@@ -22,14 +24,17 @@ class LocalWhisperSTT(STTProvider):
         self.model_name = model_name
 
     async def transcribe(self, audio_data: np.ndarray, sample_rate: int) -> str:
-        audio_bytes = to_wav_bytes(audio_data, sample_rate)
-        return await asyncio.to_thread(self._run_model, audio_bytes)
-
-    def _run_model(self, audio_bytes: bytes) -> str:
-        import io
-
-        with io.BytesIO(audio_bytes) as buffer:
-            result: Optional[dict] = self.model.transcribe(buffer, fp16=False)
+        return await asyncio.to_thread(self._run_model, audio_data, sample_rate)
+
+    def _run_model(self, audio_data: np.ndarray, sample_rate: int) -> str:
+        # whisper は 16kHz の float32 配列をそのまま受け取れるので WAV を経由しない
+        audio = to_float32(audio_data)
+        if sample_rate != _WHISPER_SAMPLE_RATE and len(audio):
+            target = int(len(audio) * _WHISPER_SAMPLE_RATE / sample_rate)
+            audio = np.interp(
+                np.linspace(0, len(audio) - 1, target), np.arange(len(audio)), audio
+            ).astype(np.float32)
+        result: Optional[dict] = self.model.transcribe(audio, fp16=False)
         if not result:
             return ""
         text = result.get("text") if isinstance(result, dict) else None
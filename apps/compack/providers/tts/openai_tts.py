@@ -3,16 +3,15 @@ from __future__ import annotations
 import asyncio
 from typing import Optional
 
-import openai
-
 from apps.compack.modules.tts import TTSProvider
+from apps.compack.providers.openai_client import get_openai_client
 
 
 class OpenAITTSTTS(TTSProvider):
     """OpenAI TTS API 実装."""
 
     def __init__(self, api_key: str, voice: str = "alloy", model: str = "gpt-4o-mini-tts", speed: float = 1.0):
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.voice = voice
         self.model = model
         self.speed = speed
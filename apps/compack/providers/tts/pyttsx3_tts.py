@@ -1,14 +1,36 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import os
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from typing import List, Optional, Tuple
 
 from apps.compack.modules.tts import TTSProvider
 
+# RAM 上の tmpfs があればそこに書かせ、ディスクへの書き込みと読み戻しを避ける
+_SHM_DIR = "/dev/shm"
+_TMP_DIR = _SHM_DIR if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK) else None
+# 1回のドライバ実行でまとめる最大件数（後続の待ち時間を抑える）
+_MAX_BATCH = 8
+# 外部ループで iterate() を回す間隔（秒）
+_ITERATE_INTERVAL = 0.005
+# 1件あたりの合成待ちの上限（秒）。finished-utterance が来ないドライバで固まらないように
+_UTTERANCE_TIMEOUT = 30.0
+# close() でワーカーの終了を待つ上限（秒）。超えたら daemon スレッドのまま残す
+_CLOSE_TIMEOUT = 5.0
+
 
 class Pyttsx3TTS(TTSProvider):
-    """pyttsx3 ローカル TTS 実装."""
+    """pyttsx3 ローカル TTS 実装.
+
+    エンジンは生成したスレッドでしか安全に動かせないため、専用スレッドで init から合成まで行う。
+    """
 
     def __init__(self, rate: int = 150, volume: float = 1.0):
         try:
@@ -16,16 +38,125 @@ class Pyttsx3TTS(TTSProvider):
         except ImportError as exc:  # pragma: no cover - import guard
             raise RuntimeError("pyttsx3 がインストールされていません。") from exc
 
-        self.engine = pyttsx3.init()
-        self.engine.setProperty("rate", rate)
-        self.engine.setProperty("volume", volume)
+        self._requests: "queue.Queue[Optional[Tuple[str, Future]]]" = queue.Queue()
+        # バッチごとの世代番号。古いバッチの finished-utterance を無視するために発話名に埋め込む
+        self._generation = 0
+        self._remaining = 0
+        self._batch_done = threading.Event()
+        ready: Future = Future()
+        self._thread = threading.Thread(
+            target=self._run_loop, args=(pyttsx3, rate, volume, ready), name="pyttsx3-tts", daemon=True
+        )
+        self._thread.start()
+        ready.result()  # 初期化エラーは呼び出し元へ
 
     async def synthesize(self, text: str) -> bytes:
-        return await asyncio.to_thread(self._synthesize_sync, text)
+        future: Future = Future()
+        self._requests.put((text, future))
+        return await asyncio.wrap_future(future)
+
+    def close(self) -> None:
+        """Stop the engine thread after pending requests are served (waits at most _CLOSE_TIMEOUT)."""
+        if self._thread.is_alive():
+            self._requests.put(None)
+            self._thread.join(_CLOSE_TIMEOUT)
+
+    def _run_loop(self, pyttsx3, rate: int, volume: float, ready: Future) -> None:
+        try:
+            self.engine = pyttsx3.init()
+            self.engine.setProperty("rate", rate)
+            self.engine.setProperty("volume", volume)
+            self.engine.connect("finished-utterance", self._on_finished_utterance)
+        except Exception as exc:
+            ready.set_exception(exc)
+            return
+        # runAndWait は毎回ドライバのループを立ち上げ直すので、外部ループで起動したままにする
+        try:
+            self.engine.startLoop(False)
+            self._loop_started = True
+        except Exception:
+            self._loop_started = False
+        ready.set_result(None)
+        try:
+            self._serve()
+        finally:
+            if self._loop_started:
+                with contextlib.suppress(Exception):
+                    self.engine.endLoop()
+
+    def _serve(self) -> None:
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            # 溜まっている依頼をまとめ、1回のドライバ実行で合成する
+            batch = [item]
+            stop = False
+            while len(batch) < _MAX_BATCH:
+                try:
+                    item = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            if batch:
+                self._synthesize_batch(batch)
+            if stop:
+                return
+
+    def _arm(self, count: int) -> str:
+        """Reset the completion counter for a new batch and return its utterance-name prefix."""
+        self._generation += 1
+        self._remaining = count
+        self._batch_done.clear()
+        return f"{self._generation}:"
 
-    def _synthesize_sync(self, text: str) -> bytes:
-        with NamedTemporaryFile(suffix=".wav", delete=True) as tmp:
-            self.engine.save_to_file(text, tmp.name)
+    def _on_finished_utterance(self, name: Optional[str] = None, completed: bool = True) -> None:
+        # ドライバのコールバックはエンジンのスレッド（save_to_file/iterate/runAndWait の中）で呼ばれる
+        if name is not None and not str(name).startswith(f"{self._generation}:"):
+            return  # タイムアウトで見捨てたバッチの遅延通知
+        self._remaining -= 1
+        if self._remaining <= 0:
+            self._batch_done.set()
+
+    def _wait_engine(self, count: int) -> None:
+        if not self._loop_started:
             self.engine.runAndWait()
-            tmp.seek(0)
-            return tmp.read()
+            return
+        # isBusy() は合成開始前に False を返すドライバがあるため、finished-utterance で完了を判定する。
+        # 外部ループではドライバを進めるために iterate() を回し続ける必要がある
+        deadline = time.monotonic() + _UTTERANCE_TIMEOUT * count
+        while not self._batch_done.is_set():
+            if time.monotonic() > deadline:
+                raise RuntimeError("pyttsx3 の音声合成がタイムアウトしました。")
+            self.engine.iterate()
+            self._batch_done.wait(_ITERATE_INTERVAL)
+
+    def _synthesize_batch(self, batch: List[Tuple[str, Future]]) -> None:
+        # ドライバはパスしか受け取らないので、こちらのハンドルは閉じてから書かせる
+        paths: List[str] = []
+        # キュー投入中に完了通知が来ても取りこぼさないよう、先にカウンタを用意する
+        prefix = self._arm(len(batch))
+        try:
+            for i, (text, _) in enumerate(batch):
+                fd, path = tempfile.mkstemp(suffix=".wav", dir=_TMP_DIR)
+                os.close(fd)
+                paths.append(path)
+                self.engine.save_to_file(text, path, name=f"{prefix}{i}")
+            self._wait_engine(len(batch))
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+        else:
+            for (_, future), path in zip(batch, paths):
+                try:
+                    future.set_result(Path(path).read_bytes())
+                except Exception as exc:
+                    future.set_exception(exc)
+        finally:
+            for path in paths:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(path)
@@ -1,8 +1,9 @@
-import asyncio
 from typing import Any, Dict
 
 import pytest
 
+from apps.compack.models import Config
+
 
 def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "unit: unit tests for Compack")
@@ -14,8 +15,41 @@ def sample_metadata() -> Dict[str, Any]:
     return {"source": "test"}
 
 
-@pytest.fixture
-def event_loop() -> asyncio.AbstractEventLoop:
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(scope="session")
+def base_config(tmp_path_factory: pytest.TempPathFactory) -> Config:
+    """全フィールドを埋めた Config の雛形。テストでは dataclasses.replace で必要な項目だけ差し替える。"""
+    root = tmp_path_factory.mktemp("compack")
+    return Config(
+        data_dir=root,
+        session_log_dir=root / "sessions",
+        kb_dir=root / "kb",
+        uploads_dir=root / "uploads",
+        config_dir=root / "config",
+        privacy_mode="off",
+        external_network="allow",
+        stt_provider="openai_whisper",
+        stt_openai_api_key="stt-key",
+        stt_openai_model="whisper-1",
+        stt_local_model="base",
+        llm_provider="openai_gpt4",
+        llm_openai_api_key="llm-key",
+        llm_openai_model="gpt-4",
+        llm_ollama_base_url="http://localhost:11434",
+        llm_ollama_model="llama2",
+        llm_temperature=0.7,
+        llm_max_tokens=1000,
+        tts_provider="openai_tts",
+        tts_openai_api_key="tts-key",
+        tts_openai_voice="alloy",
+        tts_openai_speed=1.0,
+        tts_pyttsx3_rate=150,
+        tts_pyttsx3_volume=1.0,
+        session_max_context_messages=5,
+        log_file=None,
+        log_level="INFO",
+        audio_sample_rate=16000,
+        audio_channels=1,
+        audio_record_duration=5.0,
+        retry_max_attempts=3,
+        retry_base_delay=1.0,
+    )
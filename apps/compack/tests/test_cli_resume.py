@@ -1,4 +1,5 @@
 import builtins
+import os
 
 import pytest
 
@@ -73,3 +74,21 @@ def test_external_category_skips_code_like(tmp_path):
     orch, _ = make_orchestrator(tmp_path)
     path_like = r"D:\data\scoreboard_latest.txt"
     assert orch._external_category(path_like) is None
+
+
+@pytest.mark.unit
+def test_resume_latest_loads_newest_session(tmp_path):
+    orch, _ = make_orchestrator(tmp_path)
+    cli = CLIInterface(orch, ConfigManager())
+
+    old_sid = orch.session.create_session()
+    orch.session.add_message("user", "old")
+    old_path = orch.session.save_session()
+    new_sid = orch.session.create_session()
+    orch.session.add_message("user", "new")
+    orch.session.save_session()
+    os.utime(old_path, (1, 1))
+
+    assert cli._init_session(resume="latest") is None
+    assert orch.session.current_session_id == new_sid != old_sid
+    assert orch.session.messages[0].content == "new"
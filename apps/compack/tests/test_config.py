@@ -1,9 +1,12 @@
 import os
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
+import requests
 
 from apps.compack.core import ConfigManager
+from apps.compack.models import Config
 
 
 @pytest.mark.unit
@@ -121,3 +124,100 @@ logging:
     assert any("OpenAI Whisper" in msg for msg in errors)
     assert any("GPT-4" in msg for msg in errors)
     assert any("TTS" in msg for msg in errors)
+
+
+@pytest.mark.unit
+def test_config_manager_reparses_yaml_only_when_changed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("COMPACK_LLM_OLLAMA_MODEL", raising=False)
+    env_file = tmp_path / "empty.env"
+    env_file.touch()
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("llm:\n  ollama:\n    model: first\n", encoding="utf-8")
+
+    manager = ConfigManager(env_path=env_file, config_path=config_file)
+    first = manager._load_yaml(config_file)
+    assert manager._load_yaml(config_file) is first
+
+    config_file.write_text("llm:\n  ollama:\n    model: second-model\n", encoding="utf-8")
+    assert manager.reload().llm_ollama_model == "second-model"
+
+
+@pytest.mark.unit
+def test_config_manager_load_is_cached_per_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("COMPACK_LLM_OLLAMA_MODEL", raising=False)
+    env_file = tmp_path / "empty.env"
+    env_file.touch()
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("data:\n  dir: \"{}\"\n".format((tmp_path / "data").as_posix()), encoding="utf-8")
+
+    first = ConfigManager(env_path=env_file, config_path=config_file).load()
+    first.profile_name = "mutated"
+    second = ConfigManager(env_path=env_file, config_path=config_file).load()
+    assert second is not first
+    assert second.profile_name == "default"
+
+    monkeypatch.setenv("COMPACK_LLM_OLLAMA_MODEL", "from-env")
+    assert ConfigManager(env_path=env_file, config_path=config_file).load().llm_ollama_model == "from-env"
+
+
+@pytest.mark.unit
+def test_config_manager_cached_list_fields_are_copied(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("COMPACK_ALLOW_PATHS", str(tmp_path))
+    env_file = tmp_path / "empty.env"
+    env_file.touch()
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("data:\n  dir: \"{}\"\n".format((tmp_path / "data").as_posix()), encoding="utf-8")
+
+    first = ConfigManager(env_path=env_file, config_path=config_file).load()
+    first.allow_paths.append("/etc")
+    first.allow_external_categories.append("mutated")
+    second = ConfigManager(env_path=env_file, config_path=config_file).load()
+    assert "/etc" not in second.allow_paths
+    assert "mutated" not in second.allow_external_categories
+
+
+@pytest.mark.unit
+def test_config_manager_recreates_deleted_dirs(tmp_path: Path) -> None:
+    env_file = tmp_path / "empty.env"
+    env_file.touch()
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("data:\n  dir: \"{}\"\n".format((tmp_path / "data").as_posix()), encoding="utf-8")
+
+    first = ConfigManager(env_path=env_file, config_path=config_file).load()
+    assert first.session_log_dir.is_dir()
+    first.session_log_dir.rmdir()
+    second = ConfigManager(env_path=env_file, config_path=config_file).load()
+    assert second.session_log_dir.is_dir()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_config_validate_live_probes_providers(base_config: Config, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    class _Resp:
+        def __init__(self, status_code: int):
+            self.status_code = status_code
+
+    def fake_get(url, headers=None, timeout=None):
+        calls.append((url, headers, timeout))
+        if "11434" in url:
+            raise requests.ConnectionError("refused")
+        return _Resp(401 if headers["Authorization"] == "Bearer bad" else 200)
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    cfg = replace(
+        base_config,
+        stt_provider="openai_whisper",
+        llm_provider="ollama",
+        tts_provider="openai_tts",
+        stt_openai_api_key="good",
+        tts_openai_api_key="bad",
+    )
+    errors = await cfg.validate_live()
+
+    assert len(calls) == 3
+    assert all(timeout == 2.0 for _, _, timeout in calls)
+    assert [e.split(":")[0] for e in errors] == ["LLM", "TTS"]
+    assert "HTTP 401" in errors[1]
+    assert await cfg.validate_live(skip_stt=True, skip_tts=True) == errors[:1]
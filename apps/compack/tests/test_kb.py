@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from apps.compack.core import KBManager
+from apps.compack.core import kb as kb_module
+
+
+@pytest.mark.unit
+def test_add_path_appends_and_search_ranks(tmp_path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("ollama model setup guide", encoding="utf-8")
+    (docs / "b.md").write_text("weather tool usage", encoding="utf-8")
+    (docs / "skip.bin").write_bytes(b"\x00\x01")
+
+    kb = KBManager(tmp_path / "kb")
+    assert kb.add_path(docs) == 2
+    assert kb.add_path(docs / "a.txt") == 1
+    assert kb.status() == {"entries": 3}
+
+    results = kb.search("ollama setup", top_k=1)
+    assert results[0]["match"]["path"].endswith("a.txt")
+    assert results[0]["score"] > 0
+
+
+@pytest.mark.unit
+def test_add_path_appends_to_legacy_index_without_trailing_newline(tmp_path) -> None:
+    kb = KBManager(tmp_path / "kb")
+    legacy = {"path": "legacy.txt", "tokens": ["legacy"], "preview": "legacy"}
+    kb.index_path.write_text(json.dumps(legacy), encoding="utf-8")
+    doc = tmp_path / "new.txt"
+    doc.write_text("fresh entry", encoding="utf-8")
+
+    assert kb.add_path(doc) == 1
+    assert kb.status() == {"entries": 2}
+    assert kb.search("legacy")[0]["match"]["path"] == "legacy.txt"
+
+
+@pytest.mark.unit
+def test_index_stores_deduplicated_sorted_tokens(tmp_path) -> None:
+    doc = tmp_path / "dup.txt"
+    doc.write_text("Beta alpha beta ALPHA gamma", encoding="utf-8")
+    kb = KBManager(tmp_path / "kb")
+    kb.add_path(doc)
+
+    entry = json.loads(kb.index_path.read_text(encoding="utf-8").splitlines()[0])
+    assert entry["tokens"] == ["alpha", "beta", "gamma"]
+
+
+@pytest.mark.unit
+def test_search_reuses_parsed_index_until_file_changes(tmp_path, monkeypatch) -> None:
+    doc = tmp_path / "a.txt"
+    doc.write_text("cached index entry", encoding="utf-8")
+    kb = KBManager(tmp_path / "kb")
+    kb.add_path(doc)
+    assert kb.search("cached")
+
+    calls = []
+    original = kb_module._loads
+    monkeypatch.setattr(kb_module, "_loads", lambda s: calls.append(s) or original(s))
+    kb.search("cached")
+    kb.status()
+    assert calls == []
+
+    other = tmp_path / "b.txt"
+    other.write_text("second document", encoding="utf-8")
+    kb.add_path(other)
+    assert kb.search("second")[0]["match"]["path"].endswith("b.txt")
+
+
+@pytest.mark.unit
+def test_add_path_walks_nested_directories(tmp_path) -> None:
+    nested = tmp_path / "docs" / "sub" / "deeper"
+    nested.mkdir(parents=True)
+    (nested / "NOTE.MD").write_text("nested note", encoding="utf-8")
+    (tmp_path / "docs" / "data.json").write_text('{"k": "v"}', encoding="utf-8")
+    (tmp_path / "docs" / "image.png").write_bytes(b"\x89PNG")
+
+    kb = KBManager(tmp_path / "kb")
+    assert kb.add_path(tmp_path / "docs") == 2
+    assert kb.add_path(tmp_path / "docs" / "image.png") == 0
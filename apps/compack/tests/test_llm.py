@@ -102,3 +102,23 @@ async def test_streaming_concat_preserves_order(chunks: List[str]) -> None:
     async for chunk in module.generate_response([{"role": "user", "content": "hi"}]):
         result_parts.append(chunk)
     assert "".join(chunks) == "".join(result_parts)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_response_accepts_plain_def_returning_async_iterator() -> None:
+    class WrappedLLMProvider(FakeLLMProvider):
+        def generate(self, messages, tools=None, stream=True):  # type: ignore[override]
+            return FakeLLMProvider.generate(self, messages, tools=tools, stream=stream)
+
+    module = LLMModule(WrappedLLMProvider(["a", "b"]), StructuredLogger(log_file=None))
+    chunks = [chunk async for chunk in module.generate_response([{"role": "user", "content": "hi"}])]
+    assert chunks == ["a", "b"]
+
+    swapped = LLMModule(FakeLLMProvider([]), StructuredLogger(log_file=None))
+
+    async def single(messages, tools=None, stream=True):
+        return "whole"
+
+    swapped.provider.generate = single  # type: ignore[method-assign]
+    assert [chunk async for chunk in swapped.generate_response([])] == ["whole"]
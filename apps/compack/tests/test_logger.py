@@ -43,3 +43,46 @@ def test_structured_logger_masks_secrets(capsys: pytest.CaptureFixture[str], sec
     assert data["api_key"] == "***"
     assert data["nested"]["token"] == "***"
     assert secret_value not in output
+
+
+@pytest.mark.unit
+def test_structured_logger_skips_disabled_levels(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    logger = StructuredLogger(log_file=None, level="WARNING")
+    monkeypatch.setattr(logger, "_mask_secrets", lambda data: pytest.fail("masking ran for a disabled level"))
+    logger.debug("hidden", api_key="x")
+    logger.info("hidden", api_key="x")
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.unit
+def test_structured_logger_renders_unusual_values(capsys: pytest.CaptureFixture[str]) -> None:
+    logger = StructuredLogger(log_file=None, level="INFO")
+    logger.info("values", error=ValueError("boom"), big=2**70, text="日本語\x85\u2028")
+
+    data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+
+    assert "boom" in data["error"]
+    assert data["big"] == 2**70
+    assert data["text"] == "日本語\x85\u2028"
+
+
+@pytest.mark.unit
+def test_structured_logger_output_is_ascii(capsys: pytest.CaptureFixture[str]) -> None:
+    logger = StructuredLogger(log_file=None, level="INFO")
+    logger.info("日本語", text="絵文字😀\x85 ")
+
+    output = capsys.readouterr().out.strip()
+    assert output.isascii()
+    assert len(output.splitlines()) == 1
+    data = json.loads(output)
+    assert data["event"] == "日本語"
+    assert data["text"] == "絵文字😀\x85 "
+
+
+@pytest.mark.unit
+def test_orjson_serializer_matches_json_escaping() -> None:
+    pytest.importorskip("orjson")
+    from apps.compack.core.logger import _orjson_dumps
+
+    obj = {"event": "日本語😀\x85 ", "plain": "ascii"}
+    assert _orjson_dumps(obj) == json.dumps(obj, separators=(",", ":"))
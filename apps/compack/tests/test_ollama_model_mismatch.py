@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 import pytest
 
 from apps.compack.providers.llm.ollama import OllamaLLM, OllamaModelNotFound
@@ -14,3 +17,153 @@ def test_model_mismatch_raises_not_found(monkeypatch):
     assert "missing" in msg
     assert "qwen2.5-coder:7b" in msg
     assert "ollama list" in msg
+
+
+class _FakeStreamResponse:
+    def __init__(self, lines):
+        self._lines = lines
+        self.status_code = 200
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def raise_for_status(self):
+        return None
+
+    def iter_content(self, chunk_size=1):
+        body = b"\n".join(self._lines)
+        return (body[i : i + 7] for i in range(0, len(body), 7))
+
+
+def test_stream_yields_message_content(monkeypatch):
+    lines = [
+        '{"message": {"content": "こん"}, "done": false}'.encode("utf-8"),
+        b"",
+        '{"message": {"content": "にちは"}, "done": false}'.encode("utf-8"),
+        b'{"message": {"content": ""}, "done": true}',
+    ]
+    provider = OllamaLLM(model="m")
+    resp = _FakeStreamResponse(lines)
+    monkeypatch.setattr(provider._http, "post", lambda *a, **kw: resp)
+    assert list(provider._iter_chunks(provider._open_stream({"model": "m"}))) == ["こん", "にちは"]
+    assert resp.closed
+
+
+@pytest.mark.asyncio
+async def test_generate_streams_off_the_event_loop(monkeypatch):
+    provider = OllamaLLM(model="m")
+    provider._cached_tags = ["m"]
+    threads = []
+
+    def fake_iter_chunks(resp):
+        for chunk in ["a", "b"]:
+            threads.append(threading.current_thread())
+            yield chunk
+
+    monkeypatch.setattr(provider, "_open_stream", lambda payload: _FakeStreamResponse([]))
+    monkeypatch.setattr(provider, "_iter_chunks", fake_iter_chunks)
+    chunks = [c async for c in provider.generate([{"role": "user", "content": "hi"}])]
+    assert chunks == ["a", "b"]
+    assert threads and all(t is not threading.main_thread() for t in threads)
+
+
+class _BlockingStreamResponse(_FakeStreamResponse):
+    """1行返した後、close() されるまで読み込みでブロックする。"""
+
+    def __init__(self):
+        super().__init__([])
+        self._closed_event = threading.Event()
+
+    def close(self):
+        super().close()
+        self._closed_event.set()
+
+    def iter_content(self, chunk_size=1):
+        yield b'{"message": {"content": "first"}}\n'
+        self._closed_event.wait(timeout=5)
+        raise ConnectionError("connection closed")
+
+
+@pytest.mark.asyncio
+async def test_generate_cancel_closes_response_while_reading(monkeypatch):
+    provider = OllamaLLM(model="m")
+    provider._cached_tags = ["m"]
+    resp = _BlockingStreamResponse()
+    monkeypatch.setattr(provider, "_open_stream", lambda payload: resp)
+    first = asyncio.Event()
+
+    async def consume():
+        async for _ in provider.generate([{"role": "user", "content": "hi"}]):
+            first.set()
+
+    task = asyncio.create_task(consume())
+    await first.wait()
+    await asyncio.sleep(0.05)  # 2回目の next() がワーカースレッドでブロックしている状態
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert resp.closed
+
+
+def test_ensure_model_exists_skips_recheck_until_model_changes(monkeypatch):
+    provider = OllamaLLM(model="a")
+    calls = []
+
+    def load_tags():
+        calls.append(1)
+        provider._cached_tags = ["a", "b"]
+        return provider._cached_tags
+
+    monkeypatch.setattr(provider, "_load_tags", load_tags)
+
+    provider.ensure_model_exists(allow_autoselect=False, raise_on_missing=True)
+    provider.ensure_model_exists(allow_autoselect=False, raise_on_missing=True)
+    assert calls == [1]
+
+    provider.model = "missing"
+    with pytest.raises(OllamaModelNotFound):
+        provider.ensure_model_exists(allow_autoselect=False, raise_on_missing=True)
+
+
+def test_load_tags_builds_tag_set_once(monkeypatch):
+    provider = OllamaLLM(model="b")
+
+    class _Resp:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"models": [{"name": "a"}, {"name": "b"}]}
+
+    monkeypatch.setattr(provider._http, "get", lambda url, timeout=None: _Resp())
+    tags = provider._load_tags()
+    tag_set = provider._tag_set(tags)
+    assert tag_set == frozenset({"a", "b"})
+    assert provider._tag_set(provider._load_tags()) is tag_set
+
+    provider.model = "missing"
+    with pytest.raises(OllamaModelNotFound):
+        provider.ensure_model_exists(allow_autoselect=False, raise_on_missing=True)
+    assert provider._tag_set(provider._cached_tags) is tag_set
+
+
+def test_http_session_is_per_thread_with_shared_pool():
+    provider = OllamaLLM(model="m")
+    main_session = provider._http
+    assert provider._http is main_session
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(provider._http))
+    worker.start()
+    worker.join()
+
+    assert other[0] is not main_session
+    assert other[0].get_adapter("http://localhost:11434") is main_session.get_adapter("http://localhost:11434")
@@ -1,8 +1,13 @@
+import asyncio
+import threading
 import numpy as np
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 
-from apps.compack.core import ConversationOrchestrator, SessionManager, StructuredLogger
+from apps.compack.core import ConversationOrchestrator, KBManager, SessionManager, StructuredLogger
+from apps.compack.core.privacy_guard import PrivacyGuard
+from apps.compack.providers.llm import OpenAIGPT4LLM
 from apps.compack.modules import (
     LLMModule,
     LLMProvider,
@@ -109,3 +114,286 @@ async def test_orchestrator_text_mode_no_tts(tmp_path: Path) -> None:
     )
     response = await orchestrator.process_text_input("text only")
     assert response == "応答です"
+
+
+@pytest.mark.unit
+def test_orchestrator_reuses_guard_result_for_same_text(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    logger = StructuredLogger(log_file=None)
+    orchestrator = ConversationOrchestrator(
+        stt=None,
+        llm=LLMModule(StubLLMProvider(), logger),
+        tts=None,
+        session=SessionManager(log_dir=tmp_path / "sessions", logger=logger),
+        tools=ToolManager(logger=logger),
+        logger=logger,
+        privacy_guard=PrivacyGuard(mode="normal"),
+    )
+    calls = []
+    original = orchestrator.privacy_guard.sanitize
+    monkeypatch.setattr(
+        orchestrator.privacy_guard,
+        "sanitize",
+        lambda text, **kw: calls.append((text, kw)) or original(text, **kw),
+    )
+    first = orchestrator._apply_guard("mail a@b.co")
+    second = orchestrator._apply_guard("mail a@b.co")
+    orchestrator._apply_guard("mail a@b.co", for_external=True)
+    assert first is second
+    assert second.text == "mail <EMAIL_REDACTED>"
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_orchestrator_speaks_sentences_while_streaming(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    events = []
+
+    class SentenceLLM(StubLLMProvider):
+        async def generate(self, messages, tools=None, stream=True):
+            for chunk in ["最初の文です。", "次の", "文です"]:
+                events.append(("llm", chunk))
+                yield chunk
+                await asyncio.sleep(0)
+
+    class RecordingTTS(TTSProvider):
+        async def synthesize(self, text: str) -> bytes:
+            events.append(("tts", text))
+            return b"audio"
+
+    logger = StructuredLogger(log_file=None)
+    tts = TTSModule(RecordingTTS(), logger)
+    monkeypatch.setattr(tts, "play_audio", lambda audio: None)
+    orchestrator = ConversationOrchestrator(
+        stt=None,
+        llm=LLMModule(SentenceLLM(), logger),
+        tts=tts,
+        session=SessionManager(log_dir=tmp_path / "sessions", logger=logger),
+        tools=ToolManager(logger=logger),
+        logger=logger,
+        enable_voice=False,
+        enable_tts=True,
+    )
+    response = await orchestrator.process_text_input("hi")
+
+    assert response == "最初の文です。次の文です"
+    spoken = [text for kind, text in events if kind == "tts"]
+    assert spoken == ["最初の文です。", "次の文です"]
+    assert events.index(("tts", "最初の文です。")) < events.index(("llm", "文です"))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_openai_stream_does_not_stall_speech(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    spoken = threading.Event()
+
+    def chunk(text: str) -> SimpleNamespace:
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+    class BlockingSDKStream:
+        closed = False
+
+        def __iter__(self):
+            yield chunk("最初の文です。")
+            # 1文目が読み上げられるまで SDK の読み込みがブロックし続ける
+            yield chunk("次の文です" if spoken.wait(timeout=5) else "読み上げが止まっていました")
+
+        def close(self):
+            self.closed = True
+
+    class RecordingTTS(TTSProvider):
+        async def synthesize(self, text: str) -> bytes:
+            spoken.set()
+            return b"audio"
+
+    provider = OpenAIGPT4LLM(api_key="test-key")
+    monkeypatch.setattr(provider, "_open_stream", lambda messages, tools: BlockingSDKStream())
+    logger = StructuredLogger(log_file=None)
+    tts = TTSModule(RecordingTTS(), logger)
+    monkeypatch.setattr(tts, "play_audio", lambda audio: None)
+    orchestrator = ConversationOrchestrator(
+        stt=None,
+        llm=LLMModule(provider, logger),
+        tts=tts,
+        session=SessionManager(log_dir=tmp_path / "sessions", logger=logger),
+        tools=ToolManager(logger=logger),
+        logger=logger,
+        enable_voice=False,
+        enable_tts=True,
+    )
+
+    assert await orchestrator.process_text_input("hi") == "最初の文です。次の文です"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_orchestrator_adds_kb_results_to_context(tmp_path: Path) -> None:
+    seen = []
+
+    class RecordingLLM(StubLLMProvider):
+        async def generate(self, messages, tools=None, stream=True):
+            seen.append(messages)
+            yield "応答です"
+
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "note.txt").write_text("compack kb preview text", encoding="utf-8")
+    kb = KBManager(tmp_path / "kb")
+    kb.add_path(tmp_path / "docs")
+    logger = StructuredLogger(log_file=None)
+    orchestrator = ConversationOrchestrator(
+        stt=None,
+        llm=LLMModule(RecordingLLM(), logger),
+        tts=None,
+        session=SessionManager(log_dir=tmp_path / "sessions", logger=logger),
+        tools=ToolManager(logger=logger),
+        logger=logger,
+        enable_voice=False,
+        enable_tts=False,
+        kb=kb,
+    )
+    await orchestrator.process_text_input("kb preview")
+
+    assert seen[0][0]["role"] == "system"
+    assert "compack kb preview text" in seen[0][0]["content"]
+    assert seen[0][-1]["role"] == "user"
+    assert seen[0][-1]["content"] == "kb preview"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_orchestrator_new_input_cancels_stale_speech(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    started = asyncio.Event()
+    spoken = []
+
+    class SlowTTS(TTSProvider):
+        async def synthesize(self, text: str) -> bytes:
+            if text == "古い応答です。":
+                started.set()
+                await asyncio.Event().wait()
+            spoken.append(text)
+            return b"audio"
+
+    class EchoLLM(StubLLMProvider):
+        async def generate(self, messages, tools=None, stream=True):
+            yield "古い応答です。" if messages[-1]["content"] == "first" else "新しい応答です。"
+
+    logger = StructuredLogger(log_file=None)
+    tts = TTSModule(SlowTTS(), logger)
+    stops = []
+    monkeypatch.setattr(tts, "play_audio", lambda audio: None)
+    monkeypatch.setattr(tts, "stop", lambda: stops.append(True))
+    orchestrator = ConversationOrchestrator(
+        stt=None,
+        llm=LLMModule(EchoLLM(), logger),
+        tts=tts,
+        session=SessionManager(log_dir=tmp_path / "sessions", logger=logger),
+        tools=ToolManager(logger=logger),
+        logger=logger,
+        enable_voice=False,
+        enable_tts=True,
+    )
+    first = asyncio.create_task(orchestrator.process_text_input("first"))
+    await asyncio.wait_for(started.wait(), 1)
+    second = await orchestrator.process_text_input("second")
+
+    assert await asyncio.wait_for(first, 1) == "古い応答です。"
+    assert second == "新しい応答です。"
+    assert spoken == ["新しい応答です。"]
+    assert stops == [True]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_speech_stream_finds_sentences_across_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    from apps.compack.core.orchestrator import _SpeechStream
+
+    spoken = []
+
+    class RecordingTTS(TTSProvider):
+        async def synthesize(self, text: str) -> bytes:
+            spoken.append(text)
+            return b"audio"
+
+    logger = StructuredLogger(log_file=None)
+    tts = TTSModule(RecordingTTS(), logger)
+    monkeypatch.setattr(tts, "play_audio", lambda audio: None)
+
+    speech = _SpeechStream(tts, logger)
+    for chunk in ["Hello", ".", " World", "!"]:
+        speech.feed(chunk)
+    await speech.finish(None)
+    assert spoken == ["Hello.", "World!"]
+
+    held = _SpeechStream(tts, logger)
+    for chunk in ["{", '"tool": "echo"', ". ", "}"]:
+        held.feed(chunk)
+    held.discard()
+    await held.finish(None)
+    assert spoken == ["Hello.", "World!"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_orchestrator_cancelled_turn_does_not_wait_for_playback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    started = asyncio.Event()
+
+    class BlockingTTS(TTSProvider):
+        async def synthesize(self, text: str) -> bytes:
+            started.set()
+            await asyncio.Event().wait()
+            return b"audio"
+
+    class SentenceLLM(StubLLMProvider):
+        async def generate(self, messages, tools=None, stream=True):
+            yield "応答です。"
+            await asyncio.Event().wait()
+
+    logger = StructuredLogger(log_file=None)
+    tts = TTSModule(BlockingTTS(), logger)
+    stops = []
+    monkeypatch.setattr(tts, "stop", lambda: stops.append(True))
+    orchestrator = ConversationOrchestrator(
+        stt=None,
+        llm=LLMModule(SentenceLLM(), logger),
+        tts=tts,
+        session=SessionManager(log_dir=tmp_path / "sessions", logger=logger),
+        tools=ToolManager(logger=logger),
+        logger=logger,
+        enable_voice=False,
+        enable_tts=True,
+    )
+    turn = asyncio.create_task(orchestrator.process_text_input("hi"))
+    await asyncio.wait_for(started.wait(), 1)
+    turn.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(turn, 1)
+    assert stops == [True]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_orchestrator_reaps_kb_task_when_session_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    logger = StructuredLogger(log_file=None)
+    session = SessionManager(log_dir=tmp_path / "sessions", logger=logger)
+    kb = SimpleNamespace(search=lambda text, top_k=3: [])
+    orchestrator = ConversationOrchestrator(
+        stt=None,
+        llm=LLMModule(StubLLMProvider(), logger),
+        tts=None,
+        session=session,
+        tools=ToolManager(logger=logger),
+        logger=logger,
+        enable_voice=False,
+        enable_tts=False,
+        kb=kb,
+    )
+
+    def broken_add_message(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(session, "add_message", broken_add_message)
+    before = asyncio.all_tasks()
+    with pytest.raises(OSError, match="disk full"):
+        await orchestrator._process_text_with_llm("hi")
+    assert all(task.done() for task in asyncio.all_tasks() - before - {asyncio.current_task()})
@@ -29,3 +29,21 @@ def test_privacy_guard_off_passes_through() -> None:
     assert result.text == text
     assert not result.masked
     assert not result.blocked
+
+
+@pytest.mark.unit
+def test_privacy_guard_reports_each_rule_once_in_rule_order() -> None:
+    guard = PrivacyGuard(mode="normal")
+    result = guard.sanitize("〒 123-4567, a@b.co, c@d.co")
+    assert result.text == "〒 <POSTCODE_REDACTED>, <EMAIL_REDACTED>, <EMAIL_REDACTED>"
+    assert result.findings == ["email", "address"]
+
+
+@pytest.mark.unit
+def test_privacy_guard_handles_full_width_and_japanese_text() -> None:
+    guard = PrivacyGuard(mode="normal")
+    assert guard.sanitize("０９０-１２３４-５６７８").text == "<PHONE_REDACTED>"
+    assert guard.sanitize("〒１２３-４５６７ です").text == "〒<POSTCODE_REDACTED> です"
+    # 単語文字（漢字）に続く番号は従来どおり境界なしとして扱う
+    assert guard.sanitize("電話090-1234-5678").text == "電話090-1234-5678"
+    assert guard.sanitize("電話 090-1234-5678").text == "電話 <PHONE_REDACTED>"
@@ -0,0 +1,253 @@
+import asyncio
+import os
+import sys
+import threading
+import types
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from apps.compack.providers.tts import Pyttsx3TTS
+
+
+class FakeEngine:
+    def __init__(self):
+        self.threads = {threading.get_ident()}
+        self.properties = {}
+        self.pending = []
+        self.paths = []
+        self.batches = []
+        self.running = threading.Event()
+        self.gate = None
+        self.loop = None
+        self.iterations = 0
+        self.run_and_wait_calls = 0
+        self.callbacks = {}
+
+    def setProperty(self, name, value):  # noqa: N802 - following pyttsx3 API
+        self.properties[name] = value
+
+    def connect(self, topic, cb):
+        self.callbacks.setdefault(topic, []).append(cb)
+
+    def save_to_file(self, text, path, name=None):
+        self.pending.append((text, path, name))
+
+    def startLoop(self, useDriverLoop=True):  # noqa: N802,N803 - following pyttsx3 API
+        self.loop = "started"
+
+    def endLoop(self):  # noqa: N802 - following pyttsx3 API
+        self.loop = "ended"
+
+    def isBusy(self):  # noqa: N802 - following pyttsx3 API
+        return bool(self.pending)
+
+    def iterate(self):
+        self.iterations += 1
+        self._run_pending()
+
+    def runAndWait(self):  # noqa: N802 - following pyttsx3 API
+        self.run_and_wait_calls += 1
+        self._run_pending()
+
+    def _run_pending(self):
+        self.threads.add(threading.get_ident())
+        self.running.set()
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        self.batches.append([text for text, _, _ in self.pending])
+        pending = list(self.pending)
+        self.pending.clear()
+        for text, path, name in pending:
+            self.paths.append(path)
+            Path(path).write_bytes(b"RIFF" + text.encode("utf-8"))
+            self.finish(name)
+
+    def finish(self, name):
+        for cb in self.callbacks.get("finished-utterance", []):
+            cb(name=name, completed=True)
+
+
+@pytest.fixture
+def fake_pyttsx3(monkeypatch: pytest.MonkeyPatch) -> List[FakeEngine]:
+    engines = []
+    module = types.ModuleType("pyttsx3")
+    module.init = lambda *args, **kwargs: engines.append(FakeEngine()) or engines[-1]
+    monkeypatch.setitem(sys.modules, "pyttsx3", module)
+    return engines
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pyttsx3_synthesize_reads_back_and_removes_file(fake_pyttsx3: List[FakeEngine]) -> None:
+    tts = Pyttsx3TTS(rate=120, volume=0.5)
+    audio = await tts.synthesize("hello")
+    tts.close()
+
+    engine = fake_pyttsx3[0]
+    assert audio == b"RIFFhello"
+    assert engine.properties == {"rate": 120, "volume": 0.5}
+    assert not os.path.exists(engine.paths[0])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pyttsx3_engine_lives_on_one_worker_thread(fake_pyttsx3: List[FakeEngine]) -> None:
+    tts = Pyttsx3TTS()
+    results = await asyncio.gather(*(tts.synthesize(text) for text in ["a", "b", "c"]))
+    tts.close()
+
+    engine = fake_pyttsx3[0]
+    assert results == [b"RIFFa", b"RIFFb", b"RIFFc"]
+    assert len(engine.threads) == 1
+    assert engine.threads != {threading.get_ident()}
+
+
+@pytest.mark.unit
+def test_pyttsx3_batches_queued_requests_into_one_run(fake_pyttsx3: List[FakeEngine]) -> None:
+    tts = Pyttsx3TTS()
+    engine = fake_pyttsx3[0]
+    engine.gate = threading.Event()
+
+    async def main() -> List[bytes]:
+        first = asyncio.ensure_future(tts.synthesize("a"))
+        await asyncio.to_thread(engine.running.wait, 5)  # 1件目がドライバ実行に入るまで待つ
+        rest = [asyncio.ensure_future(tts.synthesize(text)) for text in ["b", "c", "d"]]
+        engine.gate.set()
+        return await asyncio.gather(first, *rest)
+
+    results = asyncio.run(main())
+    tts.close()
+
+    assert results == [b"RIFFa", b"RIFFb", b"RIFFc", b"RIFFd"]
+    assert engine.batches == [["a"], ["b", "c", "d"]]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pyttsx3_keeps_external_loop_running(fake_pyttsx3: List[FakeEngine]) -> None:
+    tts = Pyttsx3TTS()
+    engine = fake_pyttsx3[0]
+    assert await tts.synthesize("a") == b"RIFFa"
+    assert await tts.synthesize("b") == b"RIFFb"
+    assert engine.loop == "started"
+    tts.close()
+
+    assert engine.loop == "ended"
+    assert engine.iterations == 2
+    assert engine.run_and_wait_calls == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pyttsx3_waits_for_finished_utterance_not_is_busy(
+    fake_pyttsx3: List[FakeEngine], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # 実ドライバは合成開始前に isBusy() が False のことがある
+    monkeypatch.setattr(FakeEngine, "isBusy", lambda self: False)
+    tts = Pyttsx3TTS()
+    assert await tts.synthesize("a") == b"RIFFa"
+    tts.close()
+
+    assert fake_pyttsx3[0].iterations == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pyttsx3_times_out_without_finished_utterance(
+    fake_pyttsx3: List[FakeEngine], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from apps.compack.providers.tts import pyttsx3_tts
+
+    monkeypatch.setattr(pyttsx3_tts, "_UTTERANCE_TIMEOUT", 0.05)
+    monkeypatch.setattr(FakeEngine, "connect", lambda self, topic, cb: None)
+    tts = Pyttsx3TTS()
+    with pytest.raises(RuntimeError, match="タイムアウト"):
+        await tts.synthesize("a")
+    tts.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pyttsx3_counts_finished_utterance_fired_while_queueing(
+    fake_pyttsx3: List[FakeEngine], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from apps.compack.providers.tts import pyttsx3_tts
+
+    monkeypatch.setattr(pyttsx3_tts, "_UTTERANCE_TIMEOUT", 1.0)
+
+    def save_and_finish(self, text, path, name=None):
+        # コマンド処理中に完了通知を出すドライバ
+        Path(path).write_bytes(b"RIFF" + text.encode("utf-8"))
+        self.finish(name)
+
+    monkeypatch.setattr(FakeEngine, "save_to_file", save_and_finish)
+    tts = Pyttsx3TTS()
+    assert await tts.synthesize("a") == b"RIFFa"
+    tts.close()
+
+
+@pytest.mark.unit
+def test_pyttsx3_ignores_finished_utterance_from_abandoned_batch(fake_pyttsx3: List[FakeEngine]) -> None:
+    tts = Pyttsx3TTS()
+    stale = tts._arm(1)
+    current = tts._arm(1)
+    tts._on_finished_utterance(name=f"{stale}0")
+    assert not tts._batch_done.is_set()
+    tts._on_finished_utterance(name=f"{current}0")
+    assert tts._batch_done.is_set()
+    tts.close()
+
+
+@pytest.mark.unit
+def test_pyttsx3_close_does_not_wait_forever(fake_pyttsx3: List[FakeEngine], monkeypatch: pytest.MonkeyPatch) -> None:
+    from apps.compack.providers.tts import pyttsx3_tts
+
+    monkeypatch.setattr(pyttsx3_tts, "_CLOSE_TIMEOUT", 0.05)
+    tts = Pyttsx3TTS()
+    engine = fake_pyttsx3[0]
+    engine.gate = threading.Event()
+
+    async def main() -> None:
+        task = asyncio.ensure_future(tts.synthesize("a"))
+        await asyncio.to_thread(engine.running.wait, 5)
+        tts.close()
+        assert tts._thread.is_alive()
+        engine.gate.set()
+        assert await task == b"RIFFa"
+
+    asyncio.run(main())
+    tts._thread.join(5)
+    assert not tts._thread.is_alive()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pyttsx3_falls_back_to_run_and_wait(
+    fake_pyttsx3: List[FakeEngine], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_external_loop(self, useDriverLoop=True):  # noqa: N803 - following pyttsx3 API
+        raise NotImplementedError
+
+    monkeypatch.setattr(FakeEngine, "startLoop", no_external_loop)
+    tts = Pyttsx3TTS()
+    assert await tts.synthesize("a") == b"RIFFa"
+    tts.close()
+
+    engine = fake_pyttsx3[0]
+    assert engine.run_and_wait_calls == 1
+    assert engine.loop is None
+
+
+@pytest.mark.unit
+def test_pyttsx3_init_error_is_raised_to_caller(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = types.ModuleType("pyttsx3")
+
+    def broken_init():
+        raise OSError("no driver")
+
+    module.init = broken_init
+    monkeypatch.setitem(sys.modules, "pyttsx3", module)
+    with pytest.raises(OSError, match="no driver"):
+        Pyttsx3TTS()
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List
@@ -118,3 +119,121 @@ def test_session_listing_complete(tmp_path: Path, session_count: int) -> None:
     sessions = manager.list_sessions()
     for sid in created:
         assert sid in sessions
+
+
+@pytest.mark.unit
+def test_session_manager_appends_only_new_messages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = SessionManager(log_dir=tmp_path / "sessions", logger=StructuredLogger(log_file=None))
+    session_id = manager.create_session()
+    manager.add_message("user", "one")
+    path = manager.save_session()
+
+    rewrites = []
+    original_write_text = Path.write_text
+    monkeypatch.setattr(Path, "write_text", lambda self, *a, **kw: rewrites.append(self) or original_write_text(self, *a, **kw))
+    manager.add_message("assistant", "two")
+    manager.save_session()
+    manager.save_session()
+
+    assert rewrites == []
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    assert [m.content for m in manager.load_session(session_id)] == ["one", "two"]
+
+
+@pytest.mark.unit
+def test_session_jsonl_keeps_unicode_line_separators_inside_content() -> None:
+    ts = datetime(2024, 1, 1)
+    session = Session(
+        session_id="s",
+        created_at=ts,
+        updated_at=ts,
+        messages=[Message(role="user", content="a\u2028b\x85c 日本語", timestamp=ts)],
+    )
+    restored = Session.from_jsonl(session_id="s", jsonl_data=session.to_jsonl())
+    assert [m.content for m in restored.messages] == ["a\u2028b\x85c 日本語"]
+
+
+@pytest.mark.unit
+def test_session_manager_context_returns_recent_messages(tmp_path: Path) -> None:
+    manager = SessionManager(log_dir=tmp_path / "sessions", logger=StructuredLogger(log_file=None), max_context_messages=3)
+    manager.create_session()
+    for text in ["a", "b", "c", "d"]:
+        manager.add_message("user", text)
+    assert [m["content"] for m in manager.get_context()] == ["b", "c", "d"]
+
+    manager.add_message("assistant", "e")
+    assert [m["content"] for m in manager.get_context()] == ["c", "d", "e"]
+    assert [m["content"] for m in manager.get_context(2)] == ["d", "e"]
+    assert [m["content"] for m in manager.get_context(5)] == ["a", "b", "c", "d", "e"]
+
+    manager.create_session()
+    assert manager.get_context() == []
+
+
+@pytest.mark.unit
+def test_session_from_jsonl_mmap_matches_text_parser() -> None:
+    ts = datetime(2024, 1, 1)
+    session = Session(
+        session_id="s",
+        created_at=ts,
+        updated_at=ts,
+        messages=[Message(role="user", content=text, timestamp=ts) for text in ["one", "two 三"]],
+    )
+    jsonl = session.to_jsonl()
+    for data in (jsonl, jsonl + "\n", jsonl.replace("\n", "\r\n") + "\r\n"):
+        restored = Session.from_jsonl_mmap(session_id="s", buffer=data.encode("utf-8"))
+        assert [m.to_dict() for m in restored.messages] == [m.to_dict() for m in session.messages]
+
+
+@pytest.mark.unit
+def test_message_is_frozen_and_caches_json_line() -> None:
+    message = Message(role="user", content="hello", timestamp=datetime(2024, 1, 1))
+    line = message.to_json()
+    assert message.to_json() is line
+    assert Message.from_dict(json.loads(line)).to_dict() == message.to_dict()
+    with pytest.raises(AttributeError):
+        message.content = "changed"  # type: ignore[misc]
+
+
+@pytest.mark.unit
+def test_session_load_path_streams_file(tmp_path: Path) -> None:
+    ts = datetime(2024, 1, 1)
+    session = Session(
+        session_id="s",
+        created_at=ts,
+        updated_at=ts,
+        messages=[Message(role="user", content=text, timestamp=ts) for text in ["one", "a b"]],
+    )
+    path = tmp_path / "abc.jsonl"
+    path.write_text(session.to_jsonl() + "\n\n", encoding="utf-8")
+
+    restored = Session.load_path(path)
+    assert restored.session_id == "abc"
+    assert [m.content for m in restored.messages] == ["one", "a b"]
+    with path.open("rb") as fh:
+        assert [m.content for m in Session.from_jsonl("s", fh).messages] == ["one", "a b"]
+    assert [m.content for m in Session.from_jsonl("s", path.read_bytes()).messages] == ["one", "a b"]
+
+
+@pytest.mark.unit
+def test_message_formats_timestamp_once() -> None:
+    ts = datetime(2024, 1, 1, 12, 30)
+    message = Message(role="user", content="hello", timestamp=ts)
+    first = message.to_dict()["timestamp"]
+    assert first == ts.isoformat()
+    assert message.to_dict()["timestamp"] is first
+    assert message.timestamp is ts
+
+
+@pytest.mark.unit
+def test_session_manager_context_mutation_does_not_leak(tmp_path: Path) -> None:
+    manager = SessionManager(log_dir=tmp_path / "sessions", logger=StructuredLogger(log_file=None), max_context_messages=3)
+    manager.create_session()
+    manager.add_message("user", "original")
+
+    context = manager.get_context()
+    context[0]["content"] = "rewritten"
+    context[0]["extra"] = True
+
+    assert manager.get_context() == [manager.messages[0].to_dict()]
+    assert manager.get_context()[0]["content"] == "original"
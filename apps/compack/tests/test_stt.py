@@ -20,9 +20,10 @@ def test_record_audio_with_mocked_device(monkeypatch: pytest.MonkeyPatch) -> Non
     frames_recorded = {}
 
     class DummySD:
-        def rec(self, frames: int, samplerate: int, channels: int, dtype: str) -> np.ndarray:
-            frames_recorded["frames"] = frames
-            return np.zeros((frames, channels), dtype=np.float32)
+        def rec(self, samplerate: int, out: np.ndarray) -> np.ndarray:
+            frames_recorded["frames"] = len(out)
+            out[:] = 0
+            return out
 
         def wait(self) -> None:
             return None
@@ -70,3 +71,92 @@ async def test_stt_transcription_non_empty(audio: list[float]) -> None:
     text = await stt_module.transcribe(audio_array, 16000)
 
     assert text != ""
+
+
+@pytest.mark.unit
+def test_record_audio_reuses_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    buffers = []
+
+    class DummySD:
+        def rec(self, samplerate: int, out: np.ndarray) -> np.ndarray:
+            buffers.append(out)
+            out[:] = 1000
+            return out
+
+        def wait(self) -> None:
+            return None
+
+    monkeypatch.setitem(sys.modules, "sounddevice", DummySD())
+    stt_module = STTModule(FakeProvider(), StructuredLogger(log_file=None), sample_rate=8000, channels=1)
+    first, _ = stt_module.record_audio(duration=0.5)
+    second, _ = stt_module.record_audio(duration=0.25)
+
+    assert first.shape == (4000,)
+    assert second.shape == (2000,)
+    assert np.shares_memory(buffers[0], buffers[1])
+
+
+@pytest.mark.unit
+def test_record_audio_downmixes_stereo_to_int16_mono(monkeypatch: pytest.MonkeyPatch) -> None:
+    class DummySD:
+        def rec(self, samplerate: int, out: np.ndarray) -> np.ndarray:
+            out[:, 0] = 32767
+            out[:, 1] = 32765
+            out[::2, 1] = -32768
+            return out
+
+        def wait(self) -> None:
+            return None
+
+    monkeypatch.setitem(sys.modules, "sounddevice", DummySD())
+    stt_module = STTModule(FakeProvider(), StructuredLogger(log_file=None), sample_rate=8000, channels=2)
+    audio, _ = stt_module.record_audio(duration=0.001)
+
+    assert audio.dtype == np.int16
+    assert audio.flags.c_contiguous
+    assert audio.tolist() == [-1, 32766, -1, 32766, -1, 32766, -1, 32766]
+
+
+@pytest.mark.unit
+def test_int16_audio_roundtrips_through_wav() -> None:
+    from apps.compack.utils.audio import from_wav_bytes, to_float32, to_wav_bytes
+
+    pcm = np.array([0, 16384, -16384, 32767], dtype=np.int16)
+    decoded, sr = from_wav_bytes(to_wav_bytes(pcm, 16000))
+
+    assert sr == 16000
+    np.testing.assert_allclose(decoded, to_float32(pcm), atol=1e-4)
+    assert to_float32(pcm).dtype == np.float32
+
+
+@pytest.mark.unit
+def test_openai_whisper_cancelled_upload_keeps_its_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+    import threading
+
+    from apps.compack.providers.stt import OpenAIWhisperSTT
+
+    stt = OpenAIWhisperSTT(api_key="test-key")
+    release = threading.Event()
+    uploads = []
+
+    def fake_transcribe_sync(buffer):
+        uploads.append((buffer, buffer.getvalue()))
+        if len(uploads) == 1:
+            release.wait(5)  # キャンセルされてもアップロードは続いている
+        return "ok"
+
+    monkeypatch.setattr(stt, "_transcribe_sync", fake_transcribe_sync)
+
+    async def main() -> None:
+        first = asyncio.ensure_future(stt.transcribe(np.zeros(100, dtype=np.float32), 16000))
+        while not uploads:
+            await asyncio.sleep(0.01)
+        first.cancel()
+        assert await stt.transcribe(np.ones(10, dtype=np.float32), 16000) == "ok"
+        release.set()
+
+    asyncio.run(main())
+    (first_buffer, first_bytes), (second_buffer, _) = uploads
+    assert first_buffer is not second_buffer
+    assert first_buffer.getvalue() == first_bytes
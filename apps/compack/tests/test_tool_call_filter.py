@@ -1,6 +1,7 @@
 import pytest
 
 from apps.compack.core import ConversationOrchestrator, SessionManager, StructuredLogger
+from apps.compack.core.orchestrator import _parse_tool_like
 from apps.compack.modules import LLMModule, LLMProvider, ToolManager
 
 
@@ -40,3 +41,11 @@ async def test_tool_like_json_retried_without_showing_user(tmp_path):
 
     response = await orch.process_text_input("テスト入力")
     assert "自然文" in response
+
+
+@pytest.mark.unit
+def test_parse_tool_like_only_accepts_named_json():
+    assert _parse_tool_like('```json\n{"name": "echo", "arguments": {"text": "hi"}}\n```') == ("echo", {"text": "hi"})
+    assert _parse_tool_like('{"args": "x", "name": "echo"}') == ("echo", {})
+    assert _parse_tool_like('{"tool": "echo"}') == (None, None)
+    assert _parse_tool_like("名前は {name} です") == (None, None)
@@ -95,3 +95,17 @@ async def test_tool_execution_returns_result(payload: Dict[str, Any]) -> None:
     result = await manager.execute("dummy", payload)
     assert result.success
     assert result.result["echo"] == payload
+
+
+@pytest.mark.unit
+def test_tool_schema_list_tracks_registration() -> None:
+    manager = ToolManager(logger=StructuredLogger(log_file=None))
+    manager.register(DummyTool(name="a"))
+    first = manager.get_tool_schemas()
+    assert manager.get_tool_schemas() is first
+    manager.register(DummyTool(name="b"))
+    assert [s["name"] for s in manager.get_tool_schemas()] == ["a", "b"]
+    replacement = DummyTool(name="a")
+    manager.register(replacement)
+    assert [s["name"] for s in manager.get_tool_schemas()] == ["a", "b"]
+    assert manager.get_tool_schemas()[0] is replacement.schema
@@ -1,4 +1,5 @@
 import sys
+import threading
 import types
 
 import pytest
@@ -74,3 +75,23 @@ async def test_tts_audio_non_empty(text: str) -> None:
     module = TTSModule(FakeTTSProvider(), StructuredLogger(log_file=None))
     audio = await module.synthesize(text)
     assert audio
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_play_runs_playback_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = TTSModule(FakeTTSProvider(), StructuredLogger(log_file=None))
+    threads = []
+    monkeypatch.setattr(module, "play_audio", lambda audio: threads.append(threading.get_ident()))
+    await module.play(b"1234")
+    assert threads and threads[0] != threading.get_ident()
+
+
+@pytest.mark.unit
+def test_close_releases_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "pygame", None)  # 再生系が無くても close できる
+    provider = FakeTTSProvider()
+    closed = []
+    monkeypatch.setattr(provider, "close", lambda: closed.append(True))
+    TTSModule(provider, StructuredLogger(log_file=None)).close()
+    assert closed == [True]
@@ -1,5 +1,5 @@
-from .audio import from_wav_bytes, to_wav_bytes
+from .audio import from_wav_bytes, to_wav_bytes, write_wav
 from .diagnostics import run_diagnostics
 from .retry import retry_async
 
-__all__ = ["from_wav_bytes", "to_wav_bytes", "retry_async", "run_diagnostics"]
+__all__ = ["from_wav_bytes", "to_wav_bytes", "write_wav", "retry_async", "run_diagnostics"]
@@ -1,28 +1,35 @@
 from __future__ import annotations
 
 import io
-from typing import Tuple
+from typing import BinaryIO, Tuple
 
 import numpy as np
 
-def to_wav_bytes(audio_data: np.ndarray, sample_rate: int) -> bytes:
-    """Encode numpy audio data into WAV bytes."""
+
+def write_wav(buffer: BinaryIO, audio_data: np.ndarray, sample_rate: int) -> None:
+    """Encode numpy audio data as WAV into an existing binary buffer."""
     try:
         import soundfile as sf
 
-        buffer = io.BytesIO()
         sf.write(buffer, audio_data, sample_rate, format="WAV")
-        return buffer.getvalue()
     except ImportError:  # pragma: no cover - optional dependency
         import wave
 
-        buffer = io.BytesIO()
         with wave.open(buffer, "wb") as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)
             wf.setframerate(sample_rate)
-            wf.writeframes((audio_data * 32767).astype("<i2").tobytes())
-        return buffer.getvalue()
+            if audio_data.dtype == np.int16:
+                wf.writeframes(audio_data.astype("<i2", copy=False).tobytes())
+            else:
+                wf.writeframes((audio_data * 32767).astype("<i2").tobytes())
+
+
+def to_wav_bytes(audio_data: np.ndarray, sample_rate: int) -> bytes:
+    """Encode numpy audio data into WAV bytes."""
+    buffer = io.BytesIO()
+    write_wav(buffer, audio_data, sample_rate)
+    return buffer.getvalue()
 
 
 def from_wav_bytes(audio_bytes: bytes) -> Tuple[np.ndarray, int]:
@@ -42,3 +49,10 @@ def from_wav_bytes(audio_bytes: bytes) -> Tuple[np.ndarray, int]:
             frames = wf.readframes(wf.getnframes())
         data = np.frombuffer(frames, dtype="<i2").astype("float32") / 32767.0
         return data, sr
+
+
+def to_float32(audio_data: np.ndarray) -> np.ndarray:
+    """Return audio as float32 in [-1, 1] (int16 PCM is scaled by 1/32768)."""
+    if audio_data.dtype == np.int16:
+        return audio_data.astype(np.float32) / 32768.0
+    return audio_data.astype(np.float32, copy=False)